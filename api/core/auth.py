@@ -2,8 +2,9 @@
 Simple API Key authentication for single-user Bitcoin Balance Tracker API
 """
 
+import hmac
+import ipaddress
 import secrets
-import hashlib
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import APIKeyHeader
 import logging
@@ -23,22 +24,48 @@ class SimpleAuth:
             name=self.settings.api_key_header_name,
             auto_error=False
         )
+        # Snapshot the allowlist once - checked on every request
+        self._allowed_ips = self.settings.allowed_ips_list
+        self._allowed_networks = self.settings.allowed_ip_networks
+        # Pre-encode the reference key so only the supplied key is
+        # encoded per request
+        self._api_key_bytes = self.settings.api_key.encode("utf-8")
     
     def verify_api_key(self, api_key: str) -> bool:
         """Verify API key"""
         if not api_key:
             return False
-        
-        # Simple constant-time comparison to prevent timing attacks
-        return secrets.compare_digest(api_key, self.settings.api_key)
+
+        try:
+            supplied = api_key.encode("utf-8")
+        except UnicodeEncodeError:
+            return False
+
+        # Constant-time comparison on bytes to prevent timing attacks
+        return hmac.compare_digest(supplied, self._api_key_bytes)
+
+    def verify_api_key_bytes(self, api_key: bytes) -> bool:
+        """Verify an API key already held as bytes (raw ASGI header value)"""
+        return bool(api_key) and hmac.compare_digest(api_key, self._api_key_bytes)
     
     def is_ip_allowed(self, ip: str) -> bool:
-        """Check if IP address is in allow list"""
-        allowed_ips = self.settings.allowed_ips_list
-        if not allowed_ips:
-            return True  # No restrictions if list is empty
-        
-        return ip in allowed_ips
+        """Check if IP address is in allow list (exact match or CIDR range)"""
+        # No restrictions if list is empty
+        if not self._allowed_ips and not self._allowed_networks:
+            return True
+
+        # O(1) fast path for bare IP entries
+        if ip in self._allowed_ips:
+            return True
+
+        if self._allowed_networks:
+            try:
+                addr = ipaddress.ip_address(ip)
+            except ValueError:
+                return False
+            return any(addr in network for network in self._allowed_networks)
+
+        return False
     
     def generate_api_key(self) -> str:
         """Generate a secure API key"""
@@ -48,13 +75,38 @@ class SimpleAuth:
 # Global auth instance
 auth = SimpleAuth()
 
+# Singleton exceptions - rejection storms shouldn't rebuild the same
+# detail/header dicts on every denied request
+_FORBIDDEN_IP_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Access denied from this IP address"
+)
+_MISSING_KEY_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="API key required (use X-API-Key header or ?api_key= query parameter)",
+    headers={"WWW-Authenticate": "ApiKey"}
+)
+_INVALID_KEY_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid API key",
+    headers={"WWW-Authenticate": "ApiKey"}
+)
+
 
 def get_client_ip(request: Request) -> str:
     """Get client IP address"""
-    # Check X-Forwarded-For header first (for proxies)
+    # Reuse the IP the combined middleware already extracted, if present
+    state = request.scope.get("state")
+    if state:
+        cached = state.get("client_ip")
+        if cached:
+            return cached
+
+    # Check X-Forwarded-For header first (for proxies).
+    # partition avoids allocating a list just to take the first entry.
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        return forwarded_for.partition(",")[0].strip()
     
     # Check X-Real-IP header
     real_ip = request.headers.get("X-Real-IP")
@@ -74,32 +126,21 @@ async def verify_api_key(
     # Check IP allowlist
     client_ip = get_client_ip(request)
     if not auth.is_ip_allowed(client_ip):
-        logger.warning(f"Access denied for IP: {client_ip}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied from this IP address"
-        )
-    
+        logger.warning("Access denied for IP: %s", client_ip)
+        raise _FORBIDDEN_IP_EXC
+
     # Check API key in header first, then in query parameters
     if not api_key:
         # Check for API key in query parameters as fallback
         api_key = request.query_params.get("api_key") or request.query_params.get("key")
-    
+
     if not api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="API key required (use X-API-Key header or ?api_key= query parameter)",
-            headers={"WWW-Authenticate": "ApiKey"}
-        )
-    
+        raise _MISSING_KEY_EXC
+
     if not auth.verify_api_key(api_key):
-        logger.warning(f"Invalid API key attempt from IP: {client_ip}")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "ApiKey"}
-        )
-    
+        logger.warning("Invalid API key attempt from IP: %s", client_ip)
+        raise _INVALID_KEY_EXC
+
     return True
 
 
@@ -2,11 +2,12 @@
 Configuration management for the Bitcoin Balance Tracker API
 """
 
+import ipaddress
 import os
 from typing import List, Optional
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -34,6 +35,8 @@ class Settings(BaseSettings):
     # Rate Limiting Configuration
     rate_limit_requests_per_minute: int = 120
     rate_limit_burst: int = 20
+    # Optional Redis backend so multiple workers share one limit
+    redis_url: Optional[str] = None
     
     # IP Allow List (optional - your server IPs)
     allowed_ips: str = ""
@@ -55,25 +58,41 @@ class Settings(BaseSettings):
             raise ValueError('Environment must be development, staging, or production')
         return v
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from string to list"""
+    @cached_property
+    def cors_origins_list(self) -> tuple:
+        """Parse CORS origins from string into a cached immutable tuple"""
         if not self.cors_origins:
-            return []
-        return [i.strip() for i in self.cors_origins.split(",") if i.strip()]
+            return ()
+        return tuple(i.strip() for i in self.cors_origins.split(",") if i.strip())
     
-    @property
-    def allowed_ips_list(self) -> List[str]:
-        """Parse allowed IPs from string to list"""
+    @cached_property
+    def allowed_ips_list(self) -> frozenset:
+        """Parse bare allowed IPs from string into a cached frozenset for O(1) lookups"""
         if not self.allowed_ips:
-            return []
-        return [i.strip() for i in self.allowed_ips.split(",") if i.strip()]
-    
-    @property
+            return frozenset()
+        return frozenset(
+            i.strip() for i in self.allowed_ips.split(",")
+            if i.strip() and "/" not in i
+        )
+
+    @cached_property
+    def allowed_ip_networks(self) -> tuple:
+        """Parse CIDR entries from the allow list into ip_network objects"""
+        networks = []
+        for token in self.allowed_ips.split(","):
+            token = token.strip()
+            if token and "/" in token:
+                try:
+                    networks.append(ipaddress.ip_network(token, strict=False))
+                except ValueError:
+                    pass  # Skip malformed entries rather than failing startup
+        return tuple(networks)
+    
+    @cached_property
     def is_production(self) -> bool:
         return self.environment == "production"
-    
-    @property
+
+    @cached_property
     def is_development(self) -> bool:
         return self.environment == "development"
     
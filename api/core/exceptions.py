@@ -4,7 +4,7 @@ Exception handlers for the Bitcoin Balance Tracker API
 
 import logging
 from fastapi import FastAPI, Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from datetime import datetime
@@ -22,13 +22,13 @@ def setup_exception_handlers(app: FastAPI):
         """Handle HTTP exceptions"""
         logger.warning(f"HTTP {exc.status_code}: {exc.detail} - {request.method} {request.url}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponse(
                 error="http_error",
                 message=exc.detail,
                 details={"status_code": exc.status_code}
-            ).dict()
+            ).model_dump(mode="json")
         )
     
     @app.exception_handler(RequestValidationError)
@@ -45,12 +45,12 @@ def setup_exception_handlers(app: FastAPI):
                 "type": error["type"]
             })
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content=ValidationErrorResponse(
                 message="Request validation failed",
                 validation_errors=validation_errors
-            ).dict()
+            ).model_dump(mode="json")
         )
     
     @app.exception_handler(ValueError)
@@ -58,12 +58,12 @@ def setup_exception_handlers(app: FastAPI):
         """Handle value errors"""
         logger.error(f"Value error: {str(exc)} - {request.method} {request.url}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content=ErrorResponse(
                 error="value_error",
                 message=str(exc)
-            ).dict()
+            ).model_dump(mode="json")
         )
     
     @app.exception_handler(Exception)
@@ -71,10 +71,10 @@ def setup_exception_handlers(app: FastAPI):
         """Handle unexpected exceptions"""
         logger.error(f"Unexpected error: {str(exc)} - {request.method} {request.url}", exc_info=True)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=ErrorResponse(
                 error="internal_server_error",
                 message="An unexpected error occurred. Please try again later."
-            ).dict()
+            ).model_dump(mode="json")
         ) 
\ No newline at end of file
@@ -21,16 +21,16 @@ sys.path.append(str(Path(__file__).parent.parent))
 from fastapi import FastAPI, Request, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
+import asyncio
 from contextlib import asynccontextmanager
 import logging
 from typing import Dict, Any
 
 from api.core.config import get_settings
-from api.middleware.rate_limiting import RateLimitMiddleware
-from api.middleware.logging import LoggingMiddleware
-from api.middleware.security_headers import SecurityHeadersMiddleware
+from api.middleware.combined import CombinedMiddleware
+from api.middleware.rate_limiting import rate_limiter
 from api.v1.routes import api_router as api_v1_router
 from api.core.exceptions import setup_exception_handlers
 from bitcoin_tracker import BitcoinTracker
@@ -59,13 +59,39 @@ async def lifespan(app: FastAPI):
     
     # Store in app state
     app.state.bitcoin_tracker = bitcoin_tracker_instance
-    
+
+    # Periodically sweep idle clients out of the in-memory rate limiter
+    # (the Redis backend relies on key expiry instead)
+    rate_limit_gc_task = None
+    if hasattr(rate_limiter, "gc_loop"):
+        rate_limit_gc_task = asyncio.create_task(rate_limiter.gc_loop())
+
+    # Refresh the discovered-server snapshot in the background so the
+    # /discover-servers endpoint serves a cached list instead of running
+    # a multi-second probe inside the request
+    discovery_task = None
+    if bitcoin_tracker_instance.config.get("enable_server_discovery", False):
+        async def _discovery_loop():
+            interval = bitcoin_tracker_instance.config.get("discover_interval", 1800)
+            while True:
+                try:
+                    await asyncio.to_thread(bitcoin_tracker_instance.discover_servers)
+                except Exception as e:
+                    logger.warning(f"Background server discovery failed: {e}")
+                await asyncio.sleep(interval)
+
+        discovery_task = asyncio.create_task(_discovery_loop())
+
     logger.info("✅ API initialization complete")
-    
+
     yield
-    
+
     # Shutdown
     logger.info("🛑 Shutting down Bitcoin Balance Tracker API")
+    if rate_limit_gc_task:
+        rate_limit_gc_task.cancel()
+    if discovery_task:
+        discovery_task.cancel()
     if bitcoin_tracker_instance and hasattr(bitcoin_tracker_instance, 'disconnect'):
         bitcoin_tracker_instance.disconnect()
 
@@ -100,16 +126,16 @@ def create_app() -> FastAPI:
         openapi_url=f"/v1/openapi.json",
         docs_url="/v1/docs",
         redoc_url="/v1/redoc",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
     # Security Middleware (order matters!)
     if settings.environment == "production":
         app.add_middleware(HTTPSRedirectMiddleware)
-    
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RateLimitMiddleware)
-    app.add_middleware(LoggingMiddleware)
+
+    # Rate limiting, security headers and logging fused into one ASGI pass
+    app.add_middleware(CombinedMiddleware)
     
     # CORS Middleware - simplified for single website
     app.add_middleware(
@@ -0,0 +1,220 @@
+"""
+Combined ASGI middleware for Bitcoin Balance Tracker API
+
+Fuses rate limiting, security headers and request logging into a single
+pure-ASGI middleware. Stacking three BaseHTTPMiddleware subclasses wraps
+every request in three extra anyio tasks and stream pairs; one ASGI
+pass does the same work with a single send wrapper.
+"""
+
+from datetime import datetime
+from time import perf_counter
+from urllib.parse import unquote_to_bytes
+import logging
+
+from api.core.auth import auth
+from api.core.config import get_settings
+from api.middleware.rate_limiting import rate_limiter
+from api.middleware.security_headers import SECURITY_HEADERS
+
+logger = logging.getLogger(__name__)
+
+# Canned rejection responses - rejection storms are exactly when these
+# paths are hot. The rate-limit body keeps its original middleware
+# shape; the auth bodies mirror the ErrorResponse schema the exception
+# handlers produce for the dependency-raised equivalents, with only the
+# timestamp filled in per response.
+_RATE_LIMIT_BODY = b'{"detail": "Rate limit exceeded. Please try again later."}'
+_FORBIDDEN_IP_TMPL = (
+    b'{"success":false,"error":"http_error",'
+    b'"message":"Access denied from this IP address",'
+    b'"details":{"status_code":403},"timestamp":"%b"}'
+)
+_MISSING_KEY_TMPL = (
+    b'{"success":false,"error":"http_error",'
+    b'"message":"API key required '
+    b'(use X-API-Key header or ?api_key= query parameter)",'
+    b'"details":{"status_code":401},"timestamp":"%b"}'
+)
+_INVALID_KEY_TMPL = (
+    b'{"success":false,"error":"http_error",'
+    b'"message":"Invalid API key",'
+    b'"details":{"status_code":401},"timestamp":"%b"}'
+)
+
+
+def _auth_error_body(template: bytes) -> bytes:
+    """Fill an ErrorResponse-shaped template with the current timestamp"""
+    return template % datetime.utcnow().isoformat().encode("latin-1")
+
+_JSON_CONTENT_TYPE = (b"content-type", b"application/json")
+_WWW_AUTHENTICATE = (b"www-authenticate", b"ApiKey")
+_RETRY_AFTER = (b"retry-after", b"60")
+
+# Routes guarded before they ever reach the router
+PROTECTED_PATH_PREFIX = "/v1/bitcoin"
+
+# Raw header name for the configured API key header
+_API_KEY_HEADER = get_settings().api_key_header_name.lower().encode("latin-1")
+
+# Paths that bypass rate limiting (health checks and docs)
+RATE_LIMIT_SKIP_PATHS = frozenset(
+    {"/", "/health", "/v1/docs", "/v1/redoc", "/v1/openapi.json"}
+)
+
+
+def get_client_ip_from_scope(scope) -> str:
+    """Get client IP address from an ASGI scope"""
+    forwarded_for = None
+    real_ip = None
+    for name, value in scope["headers"]:
+        if name == b"x-forwarded-for":
+            forwarded_for = value
+        elif name == b"x-real-ip":
+            real_ip = value
+
+    # Check X-Forwarded-For header first (for proxies) - take the first
+    # hop at the bytes level and decode only that segment
+    if forwarded_for:
+        return forwarded_for.partition(b",")[0].strip().decode("latin-1")
+
+    # Check X-Real-IP header
+    if real_ip:
+        return real_ip.decode("latin-1")
+
+    # Fall back to direct connection IP
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _find_api_key(scope) -> bytes:
+    """Pull the API key from headers or, as a fallback, the query string"""
+    for name, value in scope["headers"]:
+        if name == _API_KEY_HEADER:
+            return value
+
+    query_string = scope.get("query_string", b"")
+    if query_string:
+        for param in query_string.split(b"&"):
+            name, _, value = param.partition(b"=")
+            if name in (b"api_key", b"key"):
+                # Match request.query_params semantics so a key that
+                # authenticated via the dependency's parsed value still
+                # does: decode %-escapes and plus-as-space
+                if b"%" in value or b"+" in value:
+                    value = unquote_to_bytes(value.replace(b"+", b" "))
+                return value
+
+    return b""
+
+
+async def _send_json(send, status_code: int, body: bytes, extra_headers=()):
+    """Emit a canned JSON response without building a Response object"""
+    headers = [_JSON_CONTENT_TYPE]
+    headers.extend(extra_headers)
+    headers.extend(SECURITY_HEADERS)
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": headers,
+    })
+    await send({
+        "type": "http.response.body",
+        "body": body,
+    })
+
+
+class CombinedMiddleware:
+    """Rate limiting + security headers + logging in one ASGI pass"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        client_ip = get_client_ip_from_scope(scope)
+        # Share the resolved IP with downstream consumers (auth dependency)
+        scope.setdefault("state", {})["client_ip"] = client_ip
+
+        # Check rate limit (skipped for health check and docs)
+        rate_headers = None
+        if path not in RATE_LIMIT_SKIP_PATHS:
+            allowed, headers = await rate_limiter.is_allowed(client_ip)
+            rate_headers = [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers.items()
+            ]
+            if not allowed:
+                logger.warning("Rate limit exceeded for IP: %s", client_ip)
+                await _send_json(
+                    send, 429, _RATE_LIMIT_BODY, rate_headers + [_RETRY_AFTER]
+                )
+                return
+
+        # Authenticate protected routes before they reach the router -
+        # rejected requests never pay routing or dependency resolution
+        if path.startswith(PROTECTED_PATH_PREFIX):
+            if not auth.is_ip_allowed(client_ip):
+                logger.warning("Access denied for IP: %s", client_ip)
+                await _send_json(
+                    send, 403, _auth_error_body(_FORBIDDEN_IP_TMPL),
+                    rate_headers or ()
+                )
+                return
+
+            api_key = _find_api_key(scope)
+            if not api_key:
+                await _send_json(
+                    send, 401, _auth_error_body(_MISSING_KEY_TMPL),
+                    (rate_headers or []) + [_WWW_AUTHENTICATE]
+                )
+                return
+            if not auth.verify_api_key_bytes(api_key):
+                logger.warning("Invalid API key attempt from IP: %s", client_ip)
+                await _send_json(
+                    send, 401, _auth_error_body(_INVALID_KEY_TMPL),
+                    (rate_headers or []) + [_WWW_AUTHENTICATE]
+                )
+                return
+
+        # Log request - lazy % formatting so a raised log level skips
+        # message construction entirely
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Request: %s %s from %s", method, path, client_ip)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                process_time = perf_counter() - start_time
+
+                # Inject security, rate limit and timing headers in one pass
+                headers = list(message.get("headers", []))
+                headers.extend(SECURITY_HEADERS)
+                if rate_headers:
+                    headers.extend(rate_headers)
+                headers.append((b"x-process-time", str(process_time).encode("latin-1")))
+                message["headers"] = headers
+
+                # Log response
+                if log_info:
+                    logger.info(
+                        "Response: %s for %s %s (%.3fs)",
+                        message["status"], method, path, process_time
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            process_time = perf_counter() - start_time
+            logger.error(
+                "Error: %s for %s %s from %s (%.3fs)",
+                e, method, path, client_ip, process_time
+            )
+            raise
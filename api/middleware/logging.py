@@ -1,69 +0,0 @@
-"""
-Logging middleware for Bitcoin Balance Tracker API
-"""
-
-import time
-import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-import json
-
-logger = logging.getLogger(__name__)
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Log all requests and responses"""
-    
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        
-        # Get client info
-        client_ip = self.get_client_ip(request)
-        user_agent = request.headers.get("User-Agent", "unknown")
-        
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {client_ip} ({user_agent})"
-        )
-        
-        # Process request
-        try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                f"Response: {response.status_code} "
-                f"for {request.method} {request.url.path} "
-                f"({process_time:.3f}s)"
-            )
-            
-            # Add timing header
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            return response
-            
-        except Exception as e:
-            process_time = time.time() - start_time
-            logger.error(
-                f"Error: {str(e)} "
-                f"for {request.method} {request.url.path} "
-                f"from {client_ip} ({process_time:.3f}s)"
-            )
-            raise
-    
-    def get_client_ip(self, request: Request) -> str:
-        """Get client IP address"""
-        # Check X-Forwarded-For header first (for proxies)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        # Check X-Real-IP header
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        # Fall back to direct connection IP
-        return request.client.host if request.client else "unknown" 
\ No newline at end of file
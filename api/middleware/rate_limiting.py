@@ -2,107 +2,141 @@
 Simple rate limiting middleware for Bitcoin Balance Tracker API
 """
 
+import asyncio
 import time
+from collections import OrderedDict
+from time import monotonic
 from typing import Dict, Tuple
-from fastapi import Request, Response, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 
 from api.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on tracked clients - spoofed X-Forwarded-For spray attacks
+# otherwise grow the bucket dict without bound
+MAX_TRACKED_CLIENTS = 100_000
+
 
 class SimpleRateLimiter:
-    """Simple in-memory rate limiter"""
-    
+    """Simple in-memory token-bucket rate limiter"""
+
     def __init__(self):
-        self.requests: Dict[str, list] = {}
+        # key -> [tokens, last_refill], LRU-ordered so the cap evicts
+        # the least recently seen client
+        self.buckets: "OrderedDict[str, list]" = OrderedDict()
         self.settings = get_settings()
-    
-    def is_allowed(self, key: str) -> Tuple[bool, Dict[str, str]]:
+        # Resolve settings once - these are read on every request
+        self._limit = self.settings.rate_limit_requests_per_minute
+        self._rate = self._limit / 60.0  # tokens per second
+        self._limit_header = str(self._limit)
+
+    async def is_allowed(self, key: str) -> Tuple[bool, Dict[str, str]]:
         """Check if request is allowed and return rate limit headers"""
-        now = time.time()
-        window = 60  # 1 minute window
-        
-        # Clean old requests
-        if key in self.requests:
-            self.requests[key] = [req_time for req_time in self.requests[key] if now - req_time < window]
+        # Monotonic clock for window math - immune to NTP slews
+        now = monotonic()
+        limit = self._limit
+        rate = self._rate
+
+        # Refill in place - O(1) per call, two floats per client
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= MAX_TRACKED_CLIENTS:
+                self.buckets.popitem(last=False)
+            bucket = self.buckets[key] = [float(limit), now]
         else:
-            self.requests[key] = []
-        
-        # Check limits
-        current_requests = len(self.requests[key])
-        limit = self.settings.rate_limit_requests_per_minute
-        
+            self.buckets.move_to_end(key)
+            bucket[0] = min(float(limit), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        tokens = bucket[0]
+
         # Rate limit headers
         headers = {
-            "X-RateLimit-Limit": str(limit),
-            "X-RateLimit-Remaining": str(max(0, limit - current_requests)),
-            "X-RateLimit-Reset": str(int(now + window))
+            "X-RateLimit-Limit": self._limit_header,
+            "X-RateLimit-Remaining": str(int(tokens)),
+            "X-RateLimit-Reset": str(int(time.time() + (limit - tokens) / rate))
         }
-        
+
         # Check if allowed
-        if current_requests >= limit:
+        if tokens < 1.0:
+            # Time until one full token refills
+            headers["X-RateLimit-Reset"] = str(int(time.time() + (1.0 - tokens) / rate))
             return False, headers
-        
-        # Allow and record request
-        self.requests[key].append(now)
-        headers["X-RateLimit-Remaining"] = str(limit - current_requests - 1)
-        
+
+        # Allow and consume a token
+        bucket[0] = tokens - 1.0
+        headers["X-RateLimit-Remaining"] = str(int(bucket[0]))
+
         return True, headers
 
+    async def gc_loop(self, interval: int = 60):
+        """Periodically drop buckets for clients that have gone idle"""
+        while True:
+            await asyncio.sleep(interval)
+            now = monotonic()
+            for key, bucket in list(self.buckets.items()):
+                # A bucket idle for a full window has refilled completely,
+                # so deleting it cannot let a client exceed the limit
+                if now - bucket[1] >= 60:
+                    del self.buckets[key]
 
-# Global rate limiter instance
-rate_limiter = SimpleRateLimiter()
-
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware"""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Skip rate limiting for health check
-        if request.url.path in ["/health", "/", "/v1/docs", "/v1/redoc", "/v1/openapi.json"]:
-            return await call_next(request)
-        
-        # Get client identifier
-        client_ip = self.get_client_ip(request)
-        
-        # Check rate limit
-        allowed, headers = rate_limiter.is_allowed(client_ip)
-        
-        if not allowed:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return Response(
-                content='{"detail": "Rate limit exceeded. Please try again later."}',
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                headers={
-                    **headers,
-                    "Content-Type": "application/json",
-                    "Retry-After": "60"
-                }
+
+class RedisRateLimiter:
+    """Redis-backed fixed-window rate limiter shared across workers
+
+    A single INCR per request keeps all uvicorn workers counting against
+    the same limit, and Redis key expiry replaces the in-memory GC loop.
+    """
+
+    def __init__(self, redis_url: str):
+        import redis.asyncio as redis  # Optional dependency
+        self.redis = redis.from_url(redis_url)
+        self.settings = get_settings()
+        self._limit = self.settings.rate_limit_requests_per_minute
+        self._limit_header = str(self._limit)
+
+    async def is_allowed(self, key: str) -> Tuple[bool, Dict[str, str]]:
+        """Check if request is allowed and return rate limit headers"""
+        window_key = f"rl:{key}"
+
+        try:
+            # SET NX seeds the key with its TTL before INCR touches it,
+            # all in one MULTI/EXEC round-trip - the window key can
+            # never exist without an expiry, so a crash between the two
+            # commands can't leave a client rate-limited forever
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(window_key, 0, ex=60, nx=True)
+                pipe.incr(window_key)
+                _, count = await pipe.execute()
+        except Exception as e:
+            # A Redis outage must not take the API down with it; fail
+            # open rather than 500 every request on every worker
+            logger.warning("Redis rate limiter unavailable, failing open: %s", e)
+            return True, {"X-RateLimit-Limit": self._limit_header}
+
+        headers = {
+            "X-RateLimit-Limit": self._limit_header,
+            "X-RateLimit-Remaining": str(max(0, self._limit - count)),
+            "X-RateLimit-Reset": str(int(time.time() + 60))
+        }
+
+        return count <= self._limit, headers
+
+
+def _create_rate_limiter():
+    """Pick the Redis backend when configured, in-memory otherwise"""
+    settings = get_settings()
+    if settings.redis_url:
+        try:
+            return RedisRateLimiter(settings.redis_url)
+        except ImportError:
+            logger.warning(
+                "redis_url is set but the redis package is not installed; "
+                "falling back to in-memory rate limiting"
             )
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers to response
-        for key, value in headers.items():
-            response.headers[key] = value
-        
-        return response
-    
-    def get_client_ip(self, request: Request) -> str:
-        """Get client IP address"""
-        # Check X-Forwarded-For header first (for proxies)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        # Check X-Real-IP header
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        # Fall back to direct connection IP
-        return request.client.host if request.client else "unknown" 
\ No newline at end of file
+    return SimpleRateLimiter()
+
+
+# Global rate limiter instance
+rate_limiter = _create_rate_limiter()
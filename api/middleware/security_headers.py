@@ -2,48 +2,45 @@
 Security headers middleware for Bitcoin Balance Tracker API
 """
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses"""
-    
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Security headers
-        security_headers = {
-            # Prevent XSS attacks
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            
-            # Content Security Policy
-            "Content-Security-Policy": (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data:; "
-                "connect-src 'self'"
-            ),
-            
-            # HTTPS enforcement in production
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            
-            # Referrer policy
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            
-            # Permissions policy
-            "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
-            
-            # Server identification
-            "Server": "Bitcoin-API/1.0"
-        }
-        
-        # Add headers to response
-        for header, value in security_headers.items():
-            response.headers[header] = value
-        
-        return response 
\ No newline at end of file
+from api.core.config import get_settings
+
+
+def _build_security_headers() -> tuple:
+    """Build the constant security headers once at import time"""
+    headers = {
+        # Prevent XSS attacks
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": "DENY",
+        "X-XSS-Protection": "1; mode=block",
+
+        # Content Security Policy
+        "Content-Security-Policy": (
+            "default-src 'self'; "
+            "script-src 'self' 'unsafe-inline'; "
+            "style-src 'self' 'unsafe-inline'; "
+            "img-src 'self' data:; "
+            "connect-src 'self'"
+        ),
+
+        # Referrer policy
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+
+        # Permissions policy
+        "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+
+        # Server identification
+        "Server": "Bitcoin-API/1.0"
+    }
+
+    # HTTPS enforcement only matters in production
+    if get_settings().environment == "production":
+        headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+
+    return tuple(
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in headers.items()
+    )
+
+
+# Precomputed raw (name, value) pairs - every response carries these
+SECURITY_HEADERS = _build_security_headers()
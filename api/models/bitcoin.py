@@ -2,7 +2,7 @@
 Bitcoin-related data models for the API
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
 from datetime import datetime
@@ -11,23 +11,25 @@ from datetime import datetime
 class AddressRequest(BaseModel):
     """Single address request"""
     address: str = Field(..., description="Bitcoin address")
-    
-    @validator('address')
-    def validate_address_format(cls, v):
-        if not v or len(v.strip()) == 0:
+
+    @field_validator('address')
+    @classmethod
+    def validate_address_format(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
             raise ValueError("Address cannot be empty")
-        return v.strip()
+        return v
 
 
 class MultipleAddressRequest(BaseModel):
     """Multiple addresses request"""
-    addresses: List[str] = Field(..., min_items=1, max_items=50, description="List of Bitcoin addresses")
-    
-    @validator('addresses')
-    def validate_addresses(cls, v):
-        if not v:
-            raise ValueError("At least one address required")
-        cleaned = [addr.strip() for addr in v if addr.strip()]
+    addresses: List[str] = Field(..., min_length=1, max_length=50, description="List of Bitcoin addresses")
+
+    @field_validator('addresses')
+    @classmethod
+    def validate_addresses(cls, v: List[str]) -> List[str]:
+        # Strip and drop blanks in a single pass
+        cleaned = [stripped for addr in v if (stripped := addr.strip())]
         if not cleaned:
             raise ValueError("No valid addresses provided")
         return cleaned
@@ -57,6 +59,7 @@ class AddressHistory(BaseModel):
     total_transactions: int = Field(..., description="Total number of transactions")
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Transactions per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class ServerInfo(BaseModel):
@@ -4,6 +4,8 @@ Bitcoin API endpoints - Simplified for single-user
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from typing import List, Optional, Dict, Any
+import asyncio
+import base64
 import logging
 from decimal import Decimal
 from datetime import datetime
@@ -27,6 +29,37 @@ def get_bitcoin_tracker(request: Request) -> BitcoinTracker:
     return request.app.state.bitcoin_tracker
 
 
+def _encode_cursor(height: int, txid: str) -> str:
+    """Encode a (height, txid) pagination cursor"""
+    return base64.urlsafe_b64encode(f"{height}:{txid}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Optional[tuple]:
+    """Decode a pagination cursor; returns None if malformed"""
+    try:
+        height, _, txid = base64.urlsafe_b64decode(cursor.encode()).decode().partition(":")
+        return int(height), txid
+    except Exception:
+        return None
+
+
+def _format_tx(tx: Dict[str, Any], _Decimal=Decimal) -> Dict[str, Any]:
+    """Shape a raw history entry into the response schema"""
+    _get = tx.get
+    fee = _get("fee")
+    return {
+        "txid": _get("tx_hash", ""),
+        "confirmations": _get("confirmations", 0),
+        "block_height": _get("height"),
+        "timestamp": _get("timestamp"),
+        "value": _Decimal(str(_get("value", "0"))),
+        "fee": _Decimal(str(fee)) if fee else None,
+        "size": _get("size"),
+        "inputs": _get("inputs", []),
+        "outputs": _get("outputs", [])
+    }
+
+
 @router.get(
     "/balance/{address}",
     response_model=SuccessResponse,
@@ -48,8 +81,8 @@ async def get_address_balance(
                 detail="Invalid Bitcoin address format"
             )
         
-        # Get balance
-        balance_data = bitcoin_tracker.get_balance(address)
+        # Get balance off-thread so the event loop keeps serving
+        balance_data = await asyncio.to_thread(bitcoin_tracker.get_balance, address)
         
         if not balance_data:
             raise HTTPException(
@@ -57,13 +90,14 @@ async def get_address_balance(
                 detail="Address not found or unable to fetch balance"
             )
         
-        # Format response
-        address_balance = AddressBalance(
+        # Format response - model_construct skips re-validating values
+        # we just produced ourselves
+        address_balance = AddressBalance.model_construct(
             address=address,
-            confirmed_balance=Decimal(str(balance_data.get('confirmed', '0'))),
-            unconfirmed_balance=Decimal(str(balance_data.get('unconfirmed', '0'))),
-            total_balance=Decimal(str(balance_data.get('total', '0'))),
-            address_type=balance_data.get('address_type', 'unknown'),
+            confirmed_balance=balance_data.confirmed,
+            unconfirmed_balance=balance_data.unconfirmed,
+            total_balance=balance_data.total,
+            address_type=balance_data.address_type,
             last_updated=datetime.utcnow().isoformat()
         )
         
@@ -96,24 +130,43 @@ async def get_multiple_balances(
 ):
     """Get balances for multiple addresses"""
     try:
-        balances = []
-        
-        for address in request_data.addresses:
-            try:
-                balance_data = bitcoin_tracker.get_balance(address)
-                if balance_data:
-                    address_balance = AddressBalance(
-                        address=address,
-                        confirmed_balance=Decimal(str(balance_data.get('confirmed', '0'))),
-                        unconfirmed_balance=Decimal(str(balance_data.get('unconfirmed', '0'))),
-                        total_balance=Decimal(str(balance_data.get('total', '0'))),
-                        address_type=balance_data.get('address_type', 'unknown'),
-                        last_updated=datetime.utcnow().isoformat()
-                    )
-                    balances.append(address_balance)
-            except Exception as e:
-                logger.warning(f"Failed to get balance for {address}: {e}")
+        # Deduplicate first (order-preserving) so repeated addresses in
+        # the request cost one lookup, then fan the unique work out to
+        # worker threads instead of serializing N round-trips
+        unique_addresses = list(dict.fromkeys(request_data.addresses))
+        results = await asyncio.gather(
+            *[
+                asyncio.to_thread(bitcoin_tracker.get_balance, address)
+                for address in unique_addresses
+            ],
+            return_exceptions=True
+        )
+
+        # One timestamp for the whole response; model_construct skips
+        # re-validating values we just produced ourselves
+        now_iso = datetime.utcnow().isoformat()
+
+        by_address = {}
+        for address, balance_data in zip(unique_addresses, results):
+            if isinstance(balance_data, Exception):
+                logger.warning(f"Failed to get balance for {address}: {balance_data}")
                 continue
+            if balance_data:
+                by_address[address] = AddressBalance.model_construct(
+                    address=address,
+                    confirmed_balance=balance_data.confirmed,
+                    unconfirmed_balance=balance_data.unconfirmed,
+                    total_balance=balance_data.total,
+                    address_type=balance_data.address_type,
+                    last_updated=now_iso
+                )
+
+        # Expand back to the caller's original positions
+        balances = [
+            by_address[address]
+            for address in request_data.addresses
+            if address in by_address
+        ]
         
         return SuccessResponse(
             message=f"Retrieved balances for {len(balances)} addresses",
@@ -138,7 +191,8 @@ async def get_address_history(
     address: str,
     request: Request,
     limit: int = Query(10, ge=1, le=100, description="Number of transactions to return"),
-    offset: int = Query(0, ge=0, description="Number of transactions to skip"),
+    offset: int = Query(0, ge=0, description="Number of transactions to skip (deprecated, prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
     authenticated: bool = require_api_key,
     bitcoin_tracker: BitcoinTracker = Depends(get_bitcoin_tracker)
 ):
@@ -151,8 +205,8 @@ async def get_address_history(
                 detail="Invalid Bitcoin address format"
             )
         
-        # Get transaction history
-        history_data = bitcoin_tracker.get_transaction_history(address)
+        # Get transaction history off-thread so the event loop keeps serving
+        history_data = await asyncio.to_thread(bitcoin_tracker.get_transaction_history, address)
         
         if not history_data:
             return SuccessResponse(
@@ -166,32 +220,42 @@ async def get_address_history(
                 )
             )
         
-        # Apply pagination
+        # Apply pagination - a cursor pins the page to its predecessor's
+        # last (height, txid) so pages stay stable as new txs arrive
         total_transactions = len(history_data)
-        paginated_transactions = history_data[offset:offset + limit]
-        
-        # Format transactions
-        formatted_transactions = []
-        for tx in paginated_transactions:
-            formatted_tx = {
-                "txid": tx.get("tx_hash", ""),
-                "confirmations": tx.get("confirmations", 0),
-                "block_height": tx.get("height"),
-                "timestamp": tx.get("timestamp"),
-                "value": Decimal(str(tx.get("value", "0"))),
-                "fee": Decimal(str(tx.get("fee", "0"))) if tx.get("fee") else None,
-                "size": tx.get("size"),
-                "inputs": tx.get("inputs", []),
-                "outputs": tx.get("outputs", [])
-            }
-            formatted_transactions.append(formatted_tx)
+        if cursor:
+            decoded = _decode_cursor(cursor)
+            if decoded is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor"
+                )
+            cursor_height, cursor_txid = decoded
+            start = 0
+            for i, tx in enumerate(history_data):
+                if tx.get("height") == cursor_height and tx.get("tx_hash") == cursor_txid:
+                    start = i + 1
+                    break
+        else:
+            start = offset
+        paginated_transactions = history_data[start:start + limit]
+
+        # Build the cursor for the following page, if one exists
+        next_cursor = None
+        if paginated_transactions and start + len(paginated_transactions) < total_transactions:
+            last_tx = paginated_transactions[-1]
+            next_cursor = _encode_cursor(last_tx.get("height", 0), last_tx.get("tx_hash", ""))
         
-        address_history = AddressHistory(
+        # Format transactions; fields are already shaped, so skip re-validation
+        formatted_transactions = [_format_tx(tx) for tx in paginated_transactions]
+
+        address_history = AddressHistory.model_construct(
             address=address,
             transactions=formatted_transactions,
             total_transactions=total_transactions,
-            page=(offset // limit) + 1,
-            per_page=limit
+            page=(start // limit) + 1,
+            per_page=limit,
+            next_cursor=next_cursor
         )
         
         return SuccessResponse(
@@ -267,7 +331,7 @@ async def get_server_info(
 ):
     """Get current Electrum server information"""
     try:
-        server_info_data = bitcoin_tracker.get_server_info()
+        server_info_data = await asyncio.to_thread(bitcoin_tracker.get_server_info)
         
         if not server_info_data:
             raise HTTPException(
@@ -316,7 +380,11 @@ async def discover_servers(
 ):
     """Discover and test Electrum servers"""
     try:
-        discovered_servers = bitcoin_tracker.discover_servers()
+        # Serve the background-refresh snapshot when one exists; only the
+        # first call (or a deployment without the refresh loop) probes
+        discovered_servers = bitcoin_tracker.get_cached_servers()
+        if not discovered_servers:
+            discovered_servers = await asyncio.to_thread(bitcoin_tracker.discover_servers)
         
         if not discovered_servers:
             raise HTTPException(
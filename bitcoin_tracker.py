@@ -8,30 +8,97 @@ No local Bitcoin node required!
 
 import json
 import argparse
+import os
 import time
 import sys
 import socket
 import ssl
 import hashlib
-import base58
-import binascii
+import heapq
 import random
+import signal
+from collections import OrderedDict
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Optional, Union, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 import threading
 import concurrent.futures
 
 try:
-    import requests
+    import orjson  # Optional, ~5x faster JSON parsing
 except ImportError:
-    print("Error: requests not installed. Run: pip install requests")
-    sys.exit(1)
+    orjson = None
+
+# Bound once; skips the hashlib attribute lookup on every scripthash.
+# The _hashlib binding avoids hashlib.sha256's usedforsecurity keyword
+# plumbing on each call; fall back to the public name elsewhere.
+try:
+    from _hashlib import openssl_sha256 as _sha256
+except ImportError:
+    _sha256 = hashlib.sha256
+
+def _build_polymod_table():
+    """Fold the five conditional BIP173 generator XORs per symbol into
+    a 32-entry table indexed by the checksum's top bits."""
+    gen = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+    table = []
+    for top in range(32):
+        acc = 0
+        for i in range(5):
+            if (top >> i) & 1:
+                acc ^= gen[i]
+        table.append(acc)
+    return tuple(table)
+
+
+_BECH32_POLYMOD_TBL = _build_polymod_table()
+
+
+def _scripthash_hex(script) -> str:
+    """Electrum scripthash: hex of the byte-reversed SHA256 of a script."""
+    return _sha256(script).digest()[::-1].hex()
+
+
+# Wire codec: orjson when available (bytes in/out, no intermediate
+# str decode of multi-MB history responses), stdlib json otherwise
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    # Reuse one encoder/decoder pair instead of letting json.dumps/loads
+    # rebuild them per call; compact separators also shave wire bytes.
+    _JSON_ENCODE = json.JSONEncoder(separators=(',', ':')).encode
+    _JSON_DECODE = json.JSONDecoder().decode
+
+    def _json_dumps(obj):
+        return _JSON_ENCODE(obj).encode('utf-8')
+
+    def _json_loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8')
+        return _JSON_DECODE(data)
 
 
 class ElectrumClient:
     """Simple Electrum protocol client for querying Bitcoin data."""
-    
+
+    # One TLS context shared by every client, with handshake sessions
+    # cached per host so reconnects resume instead of paying the full
+    # handshake again
+    _ssl_context = None
+    _tls_sessions: Dict[str, "ssl.SSLSession"] = {}
+
+    @classmethod
+    def _get_ssl_context(cls):
+        if cls._ssl_context is None:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            cls._ssl_context = context
+        return cls._ssl_context
+
     def __init__(self, server_host: str, server_port: int, use_ssl: bool = True, timeout: int = 10):
         """Initialize Electrum client."""
         self.server_host = server_host
@@ -39,7 +106,11 @@ class ElectrumClient:
         self.use_ssl = use_ssl
         self.timeout = timeout
         self.socket = None
+        self._rfile = None  # Buffered line reader over the socket
         self.request_id = 0
+        # Serializes socket access so concurrent callers can't interleave
+        # request/response pairs on the shared connection
+        self.lock = threading.Lock()
     
     def connect(self) -> bool:
         """Connect to the Electrum server."""
@@ -47,16 +118,46 @@ class ElectrumClient:
             # Create socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(self.timeout)
-            
+
+            # Small JSON-RPC frames shouldn't sit in Nagle's queue, and
+            # keepalive stops NAT idle timeouts from silently killing
+            # long-lived monitoring sessions
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Probe aggressively where the platform allows it so dead
+            # servers surface well before the application timeout
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            except OSError:
+                pass  # Platform caps are fine; defaults still work
+
             if self.use_ssl:
-                # Wrap with SSL
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-                self.socket = context.wrap_socket(self.socket, server_hostname=self.server_host)
-            
+                # Wrap with SSL, resuming a cached session when we have
+                # one for this host
+                context = self._get_ssl_context()
+                self.socket = context.wrap_socket(
+                    self.socket,
+                    server_hostname=self.server_host,
+                    session=self._tls_sessions.get(self.server_host)
+                )
+
             # Connect to server
             self.socket.connect((self.server_host, self.server_port))
+
+            if self.use_ssl:
+                self._tls_sessions[self.server_host] = self.socket.session
+
+            # Responses are newline-delimited; a buffered reader frames
+            # them without hand-rolled recv loops and keeps any extra
+            # bytes (e.g. server notifications) for the next read
+            self._rfile = self.socket.makefile('rb', buffering=65536)
             return True
             
         except Exception as e:
@@ -64,58 +165,135 @@ class ElectrumClient:
             return False
     
     def disconnect(self):
-        """Disconnect from the server."""
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+        """Disconnect from the server.
+
+        Taken under the client lock so a teardown can't close the
+        socket out from under another thread's in-flight request.
+        """
+        with self.lock:
+            if self._rfile:
+                try:
+                    self._rfile.close()
+                except:
+                    pass
+                self._rfile = None
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
+                self.socket = None
     
+    # Preformatted frame for the hottest call; filling in id and
+    # scripthash skips the JSON encoder entirely
+    _GET_BALANCE_TMPL = b'{"id":%d,"method":"blockchain.scripthash.get_balance","params":["%s"]}\n'
+
     def send_request(self, method: str, params: List = None) -> Optional[Dict]:
         """Send a JSON-RPC request to the server."""
-        if not self.socket:
-            return None
-        
         if params is None:
             params = []
-        
-        self.request_id += 1
-        request = {
-            "id": self.request_id,
-            "method": method,
-            "params": params
-        }
-        
+        return self._roundtrip(
+            lambda request_id: _json_dumps({
+                "id": request_id,
+                "method": method,
+                "params": params
+            }) + b'\n'
+        )
+
+    def send_get_balance(self, scripthash: str) -> Optional[Dict]:
+        """Hot-path balance query built from the preformatted template."""
+        return self._roundtrip(
+            lambda request_id: self._GET_BALANCE_TMPL % (request_id, scripthash.encode())
+        )
+
+    def _roundtrip(self, build) -> Optional[Dict]:
+        """Send one frame and receive its newline-terminated response.
+
+        `build(request_id)` produces the payload under the lock so ids
+        stay ordered with their responses on the shared socket.
+        """
+        if not self.socket:
+            return None
+
         try:
-            # Send request
-            message = json.dumps(request) + '\n'
-            self.socket.send(message.encode('utf-8'))
-            
-            # Receive response
-            response_data = ""
-            while True:
-                chunk = self.socket.recv(4096).decode('utf-8')
-                if not chunk:
-                    break
-                response_data += chunk
-                if '\n' in response_data:
-                    break
-            
-            # Parse response
-            response_line = response_data.split('\n')[0]
-            response = json.loads(response_line)
-            
+            with self.lock:
+                self.request_id += 1
+                request_id = self.request_id
+                self.socket.sendall(build(request_id))
+                # Match the reply by id - a pushed subscription
+                # notification arriving first must be skipped, not
+                # consumed as the reply (that would desynchronize every
+                # later request on this socket)
+                while True:
+                    line = self._rfile.readline()
+                    if not line:
+                        return None
+                    if not line.strip():
+                        continue
+                    response = _json_loads(line)
+                    if response.get("id") == request_id:
+                        break
+
             if "error" in response:
                 print(f"Electrum server error: {response['error']}")
                 return None
-            
+
             return response.get("result")
-            
+
         except Exception as e:
             print(f"Request failed: {e}")
             return None
 
+    def send_batch(self, calls: List[Tuple[str, List]]) -> Optional[List]:
+        """Send several JSON-RPC requests in one write and collect replies.
+
+        Requests are pipelined on the socket and responses matched back
+        by id, so one network round-trip covers the whole batch. Returns
+        a result list aligned with `calls` (None for per-call errors),
+        or None if the batch itself failed.
+        """
+        if not self.socket or not calls:
+            return None
+
+        try:
+            with self.lock:
+                id_to_index = {}
+                lines = []
+                for i, (method, params) in enumerate(calls):
+                    self.request_id += 1
+                    id_to_index[self.request_id] = i
+                    lines.append(_json_dumps({
+                        "id": self.request_id,
+                        "method": method,
+                        "params": params or []
+                    }))
+
+                self.socket.sendall(b"\n".join(lines) + b"\n")
+
+                results = [None] * len(calls)
+                received = 0
+                while received < len(calls):
+                    line = self._rfile.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    response = _json_loads(line)
+                    index = id_to_index.get(response.get("id"))
+                    if index is None:
+                        continue  # e.g. an interleaved server notification
+                    if "error" in response:
+                        print(f"Electrum server error: {response['error']}")
+                    else:
+                        results[index] = response.get("result")
+                    received += 1
+
+            return results
+
+        except Exception as e:
+            print(f"Batch request failed: {e}")
+            return None
+
 
 class ElectrumServerDiscovery:
     """Automated Electrum server discovery and health monitoring."""
@@ -139,8 +317,50 @@ class ElectrumServerDiscovery:
         self.max_servers = max_servers
         self.discovered_servers = {}  # {host:port -> {health_score, last_tested, features}}
         self.lock = threading.Lock()
-        
-    def discover_servers(self, seed_servers: List[str] = None) -> List[str]:
+        self._client_pool = {}  # host:port -> connected ElectrumClient
+
+    def _get_or_connect(self, server_addr: str) -> Optional[ElectrumClient]:
+        """Return a pooled connected client for a server.
+
+        Discovery and health checking hit the same hosts back to back;
+        sharing the connection means one TLS handshake per server per
+        cycle instead of one per phase.
+        """
+        with self.lock:
+            client = self._client_pool.get(server_addr)
+        if client:
+            return client
+
+        if ':' in server_addr:
+            host, port = server_addr.rsplit(':', 1)
+            port = int(port)
+        else:
+            host = server_addr
+            port = 50002 if self.use_ssl else 50001
+
+        client = ElectrumClient(host, port, self.use_ssl, self.timeout)
+        if not client.connect():
+            return None
+
+        with self.lock:
+            self._client_pool[server_addr] = client
+        return client
+
+    def _drop_client(self, server_addr: str, client: ElectrumClient):
+        """Remove a client from the pool and close it."""
+        with self.lock:
+            self._client_pool.pop(server_addr, None)
+        client.disconnect()
+
+    def _drain_pool(self):
+        """Disconnect and forget every pooled client."""
+        with self.lock:
+            pool, self._client_pool = self._client_pool, {}
+        for client in pool.values():
+            client.disconnect()
+
+    def discover_servers(self, seed_servers: List[str] = None,
+                         _keep_pool: bool = False) -> List[str]:
         """Discover Electrum servers using peer discovery protocol."""
         if seed_servers is None:
             seed_servers = self.SEED_SERVERS.copy()
@@ -179,27 +399,23 @@ class ElectrumServerDiscovery:
         
         result = sorted_servers[:self.max_servers]
         print(f"🎯 Found {len(result)} healthy Electrum servers")
+
+        if not _keep_pool:
+            self._drain_pool()
         return result
-    
+
     def _discover_from_server(self, server_addr: str) -> List[str]:
         """Discover peer servers from a single server."""
         try:
-            if ':' in server_addr:
-                host, port = server_addr.rsplit(':', 1)
-                port = int(port)
-            else:
-                host = server_addr
-                port = 50002 if self.use_ssl else 50001
-            
-            # Connect and get peer list
-            client = ElectrumClient(host, port, self.use_ssl, self.timeout)
-            if not client.connect():
+            # Connect (or reuse) and get peer list; the connection stays
+            # pooled for the health-check phase
+            client = self._get_or_connect(server_addr)
+            if not client:
                 return []
-            
+
             # Request peer list
             peers = client.send_request("server.peers.subscribe")
-            client.disconnect()
-            
+
             if not peers:
                 return []
             
@@ -259,27 +475,23 @@ class ElectrumServerDiscovery:
     def _health_check_single(self, server_addr: str) -> bool:
         """Health check a single server."""
         try:
-            if ':' in server_addr:
-                host, port = server_addr.rsplit(':', 1)
-                port = int(port)
-            else:
-                host = server_addr
-                port = 50002 if self.use_ssl else 50001
-            
             start_time = time.time()
-            
-            # Quick connection test
-            client = ElectrumClient(host, port, self.use_ssl, self.timeout)
-            if not client.connect():
+
+            # Quick connection test (reuses the discovery-phase socket
+            # when one is pooled)
+            client = self._get_or_connect(server_addr)
+            if not client:
                 return False
-            
+
             # Test basic functionality
             version = client.send_request("server.version", ["HealthCheck", "1.4"])
             features = client.send_request("server.features")
-            
+
             latency = time.time() - start_time
-            client.disconnect()
-            
+
+            if not (version and features):
+                self._drop_client(server_addr, client)
+
             if version and features:
                 # Calculate health score (lower latency = higher score)
                 health_score = max(0, 100 - (latency * 10))
@@ -313,15 +525,19 @@ class ElectrumServerDiscovery:
     
     def update_server_list(self, current_servers: List[str]) -> List[str]:
         """Update server list with fresh discoveries."""
-        # Discover new servers
-        fresh_servers = self.discover_servers(current_servers)
-        
-        # Combine with existing servers and remove duplicates
-        combined = list(set(current_servers + fresh_servers))
-        
-        # Re-health check all servers
-        healthy_servers = self._health_check_servers(combined)
-        
+        try:
+            # Discover new servers, keeping connections pooled for the
+            # re-check below
+            fresh_servers = self.discover_servers(current_servers, _keep_pool=True)
+
+            # Combine with existing servers and remove duplicates
+            combined = list(set(current_servers + fresh_servers))
+
+            # Re-health check all servers
+            healthy_servers = self._health_check_servers(combined)
+        finally:
+            self._drain_pool()
+
         # Return best servers
         return self.get_best_servers(min(len(healthy_servers), self.max_servers))
 
@@ -331,31 +547,42 @@ class BitcoinAddressUtils:
     
     # Bech32 character set
     BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+    # Reverse lookup: character -> 5-bit value, one dict hit per char
+    # instead of an O(32) .index() scan
+    _BECH32_REV = {c: i for i, c in enumerate(BECH32_CHARSET)}
+
+    # Base58 character set (Bitcoin alphabet) and its reverse lookup
+    BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+    _B58_REV = {c: i for i, c in enumerate(BASE58_ALPHABET)}
     
     @staticmethod
     def bech32_polymod(values):
         """Compute bech32 polymod for checksum validation."""
-        GEN = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+        tbl = _BECH32_POLYMOD_TBL
         chk = 1
         for value in values:
-            top = chk >> 25
-            chk = (chk & 0x1ffffff) << 5 ^ value
-            for i in range(5):
-                chk ^= GEN[i] if ((top >> i) & 1) else 0
+            chk = ((chk & 0x1ffffff) << 5) ^ value ^ tbl[chk >> 25]
         return chk
     
+    # Expansion of the mainnet HRP "bc"; every address we decode uses
+    # it, so skip recomputing the expansion per call
+    _HRP_BC_EXPANDED = [3, 3, 0, 2, 3]
+
     @staticmethod
     def bech32_hrp_expand(hrp):
         """Expand human readable part for bech32."""
         return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
-    
+
     @staticmethod
     def bech32_verify_checksum(hrp, data, spec):
         """Verify bech32 or bech32m checksum."""
         const = 1 if spec == "bech32" else 0x2bc830a3
-        return BitcoinAddressUtils.bech32_polymod(
-            BitcoinAddressUtils.bech32_hrp_expand(hrp) + data
-        ) == const
+        if hrp == 'bc':
+            expanded = BitcoinAddressUtils._HRP_BC_EXPANDED
+        else:
+            expanded = BitcoinAddressUtils.bech32_hrp_expand(hrp)
+        return BitcoinAddressUtils.bech32_polymod(expanded + data) == const
     
     @staticmethod
     def convertbits(data, frombits, tobits, pad=True):
@@ -380,6 +607,26 @@ class BitcoinAddressUtils:
             return None
         return ret
     
+    @staticmethod
+    def _convert_5to8(data):
+        """Regroup 5-bit symbols into bytes (strict, no padding).
+
+        Packs the payload into one big int and slices the bytes out in
+        a single to_bytes call; symbols are trusted to be <32 because
+        they come from the charset reverse table.
+        """
+        acc = 0
+        for value in data:
+            acc = (acc << 5) | value
+
+        bit_len = 5 * len(data)
+        rem = bit_len & 7
+        if rem >= 5:
+            return None
+        if rem and acc & ((1 << rem) - 1):
+            return None  # Non-zero padding bits
+        return (acc >> rem).to_bytes(bit_len >> 3, 'big')
+
     @staticmethod
     def decode_bech32(address):
         """Decode bech32 address (SegWit v0)."""
@@ -388,18 +635,21 @@ class BitcoinAddressUtils:
             
         try:
             # Split address
-            if address.rfind('1') == -1:
+            separator = address.rfind('1')
+            if separator == -1:
                 return None
-            hrp = address[:address.rfind('1')]
-            data_part = address[address.rfind('1')+1:]
+            hrp = address[:separator]
+            data_part = address[separator + 1:]
             
-            # Convert to numbers
+            # Convert to numbers via the reverse table
+            rev = BitcoinAddressUtils._BECH32_REV
             data = []
             for char in data_part:
-                if char not in BitcoinAddressUtils.BECH32_CHARSET:
+                value = rev.get(char)
+                if value is None:
                     return None
-                data.append(BitcoinAddressUtils.BECH32_CHARSET.index(char))
-            
+                data.append(value)
+
             # Verify checksum
             if not BitcoinAddressUtils.bech32_verify_checksum(hrp, data, "bech32"):
                 return None
@@ -408,20 +658,22 @@ class BitcoinAddressUtils:
             if len(data) < 6:
                 return None
             witness_version = data[0]
-            program = BitcoinAddressUtils.convertbits(data[1:-6], 5, 8, False)
-            
+            program = BitcoinAddressUtils._convert_5to8(data[1:-6])
+
             if program is None or len(program) < 2 or len(program) > 40:
                 return None
                 
             if witness_version == 0:
                 if len(program) == 20:  # P2WPKH
-                    script = bytes([0x00, 0x14]) + bytes(program)
-                    script_hash = hashlib.sha256(script).digest()
-                    return script_hash[::-1].hex()
+                    script = bytearray(22)
+                    script[1] = 0x14
+                    script[2:] = program
+                    return _scripthash_hex(script)
                 elif len(program) == 32:  # P2WSH
-                    script = bytes([0x00, 0x20]) + bytes(program)
-                    script_hash = hashlib.sha256(script).digest()
-                    return script_hash[::-1].hex()
+                    script = bytearray(34)
+                    script[1] = 0x20
+                    script[2:] = program
+                    return _scripthash_hex(script)
             
             return None
             
@@ -436,18 +688,21 @@ class BitcoinAddressUtils:
             
         try:
             # Split address
-            if address.rfind('1') == -1:
+            separator = address.rfind('1')
+            if separator == -1:
                 return None
-            hrp = address[:address.rfind('1')]
-            data_part = address[address.rfind('1')+1:]
+            hrp = address[:separator]
+            data_part = address[separator + 1:]
             
-            # Convert to numbers
+            # Convert to numbers via the reverse table
+            rev = BitcoinAddressUtils._BECH32_REV
             data = []
             for char in data_part:
-                if char not in BitcoinAddressUtils.BECH32_CHARSET:
+                value = rev.get(char)
+                if value is None:
                     return None
-                data.append(BitcoinAddressUtils.BECH32_CHARSET.index(char))
-            
+                data.append(value)
+
             # Verify bech32m checksum
             if not BitcoinAddressUtils.bech32_verify_checksum(hrp, data, "bech32m"):
                 return None
@@ -456,24 +711,53 @@ class BitcoinAddressUtils:
             if len(data) < 6:
                 return None
             witness_version = data[0]
-            program = BitcoinAddressUtils.convertbits(data[1:-6], 5, 8, False)
-            
+            program = BitcoinAddressUtils._convert_5to8(data[1:-6])
+
             if program is None or witness_version != 1 or len(program) != 32:
                 return None
                 
-            # P2TR script
-            script = bytes([0x51, 0x20]) + bytes(program)  # OP_1 + 32 bytes
-            script_hash = hashlib.sha256(script).digest()
-            return script_hash[::-1].hex()
+            # P2TR script: OP_1 + push of the 32-byte program
+            script = bytearray(34)
+            script[0] = 0x51
+            script[1] = 0x20
+            script[2:] = program
+            return _scripthash_hex(script)
             
         except Exception:
             return None
     
+    @staticmethod
+    def b58decode(address: str) -> bytes:
+        """Decode a base58 string via the reverse-alphabet table.
+
+        The digits accumulate into one big int (C-level limb math in
+        CPython), so the loop does a single Python operation per
+        character and invalid characters fail in one dict miss.
+        """
+        rev = BitcoinAddressUtils._B58_REV
+        num = 0
+        for char in address:
+            digit = rev.get(char)
+            if digit is None:
+                raise ValueError(f"Invalid base58 character: {char!r}")
+            num = num * 58 + digit
+
+        decoded = num.to_bytes((num.bit_length() + 7) // 8, 'big') if num else b''
+
+        # Leading '1' characters encode leading zero bytes
+        pad = 0
+        for char in address:
+            if char != '1':
+                break
+            pad += 1
+
+        return b'\x00' * pad + decoded
+
     @staticmethod
     def decode_legacy(address):
         """Decode legacy address (P2PKH or P2SH)."""
         try:
-            decoded = base58.b58decode(address)
+            decoded = BitcoinAddressUtils.b58decode(address)
             payload = decoded[:-4]
             version = payload[0]
             hash160 = payload[1:]
@@ -482,34 +766,46 @@ class BitcoinAddressUtils:
                 return None
                 
             if version == 0x00:  # P2PKH
-                script = bytes([0x76, 0xa9, 0x14]) + hash160 + bytes([0x88, 0xac])
+                script = bytearray(25)
+                script[0:3] = b'\x76\xa9\x14'
+                script[3:23] = hash160
+                script[23:25] = b'\x88\xac'
             elif version == 0x05:  # P2SH
-                script = bytes([0xa9, 0x14]) + hash160 + bytes([0x87])
+                script = bytearray(23)
+                script[0:2] = b'\xa9\x14'
+                script[2:22] = hash160
+                script[22] = 0x87
             else:
                 return None
-                
-            script_hash = hashlib.sha256(script).digest()
-            return script_hash[::-1].hex()
+
+            return _scripthash_hex(script)
             
         except Exception:
             return None
     
+    # Decoder dispatch keyed by prefix: 4-char key for segwit, 1-char
+    # for legacy. One dict hit replaces the startswith chain.
+    _DISPATCH = {
+        '1': decode_legacy.__func__,
+        '3': decode_legacy.__func__,
+        'bc1q': decode_bech32.__func__,
+        'bc1p': decode_bech32m.__func__,
+    }
+
     @staticmethod
+    @lru_cache(maxsize=8192)
     def address_to_scripthash(address):
-        """Convert any Bitcoin address to scripthash for Electrum queries."""
-        # Determine address type and decode accordingly
-        if address.startswith('1'):
-            return BitcoinAddressUtils.decode_legacy(address)
-        elif address.startswith('3'):
-            return BitcoinAddressUtils.decode_legacy(address)
-        elif address.startswith('bc1q'):
-            return BitcoinAddressUtils.decode_bech32(address)
-        elif address.startswith('bc1p'):
-            return BitcoinAddressUtils.decode_bech32m(address)
-        else:
-            return None
+        """Convert any Bitcoin address to scripthash for Electrum queries.
+
+        Deterministic per address, so results are memoized - repeat
+        queries for the same address skip the decode and hashing work.
+        """
+        dispatch = BitcoinAddressUtils._DISPATCH
+        decoder = dispatch.get(address[:4]) or dispatch.get(address[:1])
+        return decoder(address) if decoder else None
     
     @staticmethod
+    @lru_cache(maxsize=8192)
     def get_address_type(address):
         """Get the type of Bitcoin address."""
         if address.startswith('1'):
@@ -531,16 +827,83 @@ class BitcoinAddressUtils:
 
 
 
+SATOSHIS_PER_BTC = Decimal(100000000)
+ZERO_BTC = Decimal(0)
+
+# Hard cap on per-address cache entries - a long-running API process
+# would otherwise grow them by one entry per distinct address forever
+MAX_CACHED_ADDRESSES = 8192
+
+
+# Fixed banner/table furniture, built once instead of per print call
+_EQ60 = "=" * 60
+_SEP60 = "-" * 60
+_SEP75 = "-" * 75
+_SERVER_TABLE_HDR = f"{'Server':<35} {'Health':<8} {'Latency':<10} {'Last Tested':<15}"
+_SERVER_ROW = "{:<35} {:<8} {:<10} {:<15}".format
+
+
+def _format_btc(sats: int) -> str:
+    """Render integer satoshis as a fixed 8-decimal BTC string.
+
+    Integer divmod instead of Decimal __format__, which re-parses the
+    '.8f' spec on every call - noticeable in the per-address print loop.
+    """
+    sign = "-" if sats < 0 else ""
+    whole, frac = divmod(abs(sats), 100_000_000)
+    return f"{sign}{whole}.{frac:08d}"
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceResult:
+    """Balance for a single address.
+
+    `balance` is the human-readable summary ("0.12345678 BTC" on success,
+    an error message otherwise); the Decimal fields are always populated
+    (zeroed on error) so callers can sum without checking.
+    """
+    address: str
+    balance: str
+    confirmed: Decimal
+    unconfirmed: Decimal
+    total: Decimal
+    address_type: str
+
+
 class BitcoinTracker:
     """Bitcoin balance tracker using public Electrum servers."""
     
     def __init__(self, config_path: str = "config.json"):
         """Initialize the tracker with configuration."""
+        self.config_path = config_path
         self.config = self._load_config(config_path)
+        self._config_mtime = self._stat_config_mtime()
         self.electrum_client = None
         self.current_server = None
         self.server_discovery = None
-        
+
+        # Short-lived caches absorb bursts of repeat traffic (e.g. UI
+        # refreshes hitting the same address within seconds); LRU-ordered
+        # so the entry cap evicts the least recently seen address
+        self._balance_ttl = self.config.get("balance_ttl", 15)
+        self._balance_cache = OrderedDict()  # address -> (expires, result)
+        self._balance_cache_lock = threading.Lock()
+        # Serializes recovery so concurrent failures don't each probe
+        # every server and stomp on each other's connections
+        self._reconnect_lock = threading.Lock()
+        self._txcount_cache = OrderedDict()  # address -> (expires, count)
+        self._server_info_cache = None  # (expires, result)
+        self._cached_servers: List[str] = []  # Last discovery snapshot
+        self._server_order: List[str] = []  # Servers sorted by measured latency
+
+        # Warm the memoized scripthash/type lookups for the configured
+        # wallet so the first poll tick pays no decode or hashing cost,
+        # and surface bad config entries immediately
+        for address in self.config.get("addresses", []):
+            if BitcoinAddressUtils.address_to_scripthash(address) is None:
+                print(f"Warning: invalid address in config: {address}")
+
+
         # Initialize server discovery if enabled
         if self.config.get("enable_server_discovery", False):
             self.server_discovery = ElectrumServerDiscovery(
@@ -554,31 +917,64 @@ class BitcoinTracker:
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file."""
         try:
+            if orjson is not None:
+                with open(config_path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(config_path, 'r') as f:
                 return json.load(f)
         except FileNotFoundError:
             print(f"Error: Config file '{config_path}' not found.")
             print("Please copy config.example.json to config.json and update it.")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # Covers json and orjson decode errors
             print(f"Error: Invalid JSON in config file: {e}")
             sys.exit(1)
     
+    def _stat_config_mtime(self) -> float:
+        """Current mtime of the config file, or 0 if unreadable."""
+        try:
+            return os.stat(self.config_path).st_mtime
+        except OSError:
+            return 0.0
+
+    def _maybe_reload_config(self) -> bool:
+        """Re-parse the config only when its mtime has changed.
+
+        A steady-state monitoring tick costs one stat call and no parse;
+        edits to config.json get picked up on the next tick. Returns
+        True when a reload happened.
+        """
+        mtime = self._stat_config_mtime()
+        if not mtime or mtime == self._config_mtime:
+            return False
+        self._config_mtime = mtime
+        self.config = self._load_config(self.config_path)
+        self._balance_ttl = self.config.get("balance_ttl", 15)
+        print(f"🔄 Reloaded {self.config_path}")
+        return True
+
     def _connect_electrum(self):
-        """Connect to an available Electrum server."""
+        """Connect to an available Electrum server.
+
+        The first connect probes every configured server concurrently
+        and keeps the lowest-latency one; the measured order is cached
+        so reconnects walk the known-fastest servers instead of paying
+        cold handshakes in random order.
+        """
         servers = self.config.get("electrum_servers", [])
         use_ssl = self.config.get("use_ssl", True)
         timeout = self.config.get("timeout", 10)
-        
-        # Try configured servers first
-        if servers:
-            # Shuffle servers for load balancing
-            random.shuffle(servers)
-            
-            for server_addr in servers:
+
+        # Reconnects reuse the latency order measured at startup
+        if self._server_order:
+            for server_addr in self._server_order:
                 if self._try_connect_server(server_addr, use_ssl, timeout):
                     return
-        
+
+        # Probe configured servers first
+        if servers and self._connect_fastest(servers, use_ssl, timeout):
+            return
+
         # If no configured servers or all failed, try server discovery
         if self.server_discovery:
             print("📡 Configured servers failed, trying server discovery...")
@@ -601,6 +997,60 @@ class BitcoinTracker:
         print("❌ Error: Could not connect to any Electrum server.")
         sys.exit(1)
     
+    def _connect_fastest(self, servers: List[str], use_ssl: bool, timeout: int) -> bool:
+        """Probe servers concurrently and keep the lowest-latency one."""
+        probed = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(servers), 8)) as executor:
+            futures = [
+                executor.submit(self._probe_server, server, use_ssl, timeout)
+                for server in servers
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                if result:
+                    probed.append(result)
+
+        if not probed:
+            return False
+
+        probed.sort(key=lambda item: item[0])
+        self._server_order = [server_addr for _, server_addr, _ in probed]
+
+        rtt, server_addr, client = probed[0]
+        for _, _, loser in probed[1:]:
+            loser.disconnect()
+
+        print(f"✅ Connected to {server_addr} ({rtt * 1000:.0f} ms)")
+        self.electrum_client = client
+        self.current_server = server_addr
+        return True
+
+    def _probe_server(self, server_addr: str, use_ssl: bool,
+                      timeout: int) -> Optional[Tuple[float, str, ElectrumClient]]:
+        """Connect and time handshake + server.version; None on failure."""
+        try:
+            if ':' in server_addr:
+                host, port = server_addr.rsplit(':', 1)
+                port = int(port)
+            else:
+                host = server_addr
+                port = 50002 if use_ssl else 50001
+
+            start = time.time()
+            client = ElectrumClient(host, port, use_ssl, timeout)
+            if not client.connect():
+                return None
+
+            version = client.send_request("server.version", ["BitcoinTracker", "1.4"])
+            if not version:
+                client.disconnect()
+                return None
+
+            return time.time() - start, f"{host}:{port}", client
+
+        except Exception:
+            return None
+
     def _try_connect_server(self, server_addr: str, use_ssl: bool, timeout: int) -> bool:
         """Try to connect to a single server."""
         try:
@@ -615,8 +1065,11 @@ class BitcoinTracker:
             
             client = ElectrumClient(host, port, use_ssl, timeout)
             if client.connect():
-                # Test connection with server version
-                version = client.send_request("server.version", ["BitcoinTracker", "1.4"])
+                # Skip the server.version probe (one extra RTT) if a
+                # recent health check already verified this server
+                version = self._recent_health_version(f"{host}:{port}")
+                if version is None:
+                    version = client.send_request("server.version", ["BitcoinTracker", "1.4"])
                 if version:
                     print(f"✅ Connected to {host}:{port} - Server: {version}")
                     self.electrum_client = client
@@ -629,7 +1082,21 @@ class BitcoinTracker:
             print(f"❌ Failed to connect to {server_addr}: {e}")
         
         return False
-    
+
+    def _recent_health_version(self, server_addr: str) -> Optional[List]:
+        """Cached server.version for a host health-checked within 5 min.
+
+        Returns None when unknown or stale, in which case the caller
+        must probe the server itself.
+        """
+        if not self.server_discovery:
+            return None
+        with self.server_discovery.lock:
+            entry = self.server_discovery.discovered_servers.get(server_addr)
+        if entry and time.time() - entry.get('last_tested', 0) < 300:
+            return entry.get('version')
+        return None
+
     def validate_address(self, address: str) -> bool:
         """Validate a Bitcoin address format."""
         try:
@@ -642,120 +1109,323 @@ class BitcoinTracker:
         """Get the type of Bitcoin address."""
         return BitcoinAddressUtils.get_address_type(address)
     
-    def get_balance(self, address: str) -> Dict[str, Union[str, Decimal]]:
-        """Get balance for a single address."""
-        if not self.validate_address(address):
-            return {
-                "address": address,
-                "balance": "Invalid address",
-                "confirmed": Decimal("0"),
-                "unconfirmed": Decimal("0"),
-                "total": Decimal("0")
-            }
-        
+    def get_balance(self, address: str) -> BalanceResult:
+        """Get balance for a single address.
+
+        Successful results are cached for config["balance_ttl"] seconds
+        (default 15, 0 disables caching) so repeat queries within the
+        window skip the server round-trip entirely.
+        """
+        ttl = self._balance_ttl
+        if ttl > 0:
+            # Monotonic expiries are immune to wall-clock jumps
+            now = time.monotonic()
+            with self._balance_cache_lock:
+                cached = self._balance_cache.get(address)
+                if cached and cached[0] > now:
+                    self._balance_cache.move_to_end(address)
+                    return cached[1]
+
+        result = self._fetch_balance(address)
+
+        # Only successful queries are worth keeping
+        if ttl > 0 and result.balance.endswith("BTC"):
+            with self._balance_cache_lock:
+                cache = self._balance_cache
+                cache[address] = (time.monotonic() + ttl, result)
+                cache.move_to_end(address)
+                if len(cache) > MAX_CACHED_ADDRESSES:
+                    cache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def _error_balance(address: str, reason: str) -> BalanceResult:
+        """Build a zeroed balance entry carrying an error message."""
+        return BalanceResult(
+            address=address,
+            balance=reason,
+            confirmed=ZERO_BTC,
+            unconfirmed=ZERO_BTC,
+            total=ZERO_BTC,
+            address_type=BitcoinAddressUtils.get_address_type(address)
+        )
+
+    @staticmethod
+    def _format_balance(address: str, balance_data: Dict) -> BalanceResult:
+        """Convert a raw satoshi balance response into a BalanceResult.
+
+        Sums are done in integer satoshis; each amount is converted to
+        Decimal exactly once at the end.
+        """
+        sats_confirmed = balance_data.get("confirmed", 0)
+        sats_unconfirmed = balance_data.get("unconfirmed", 0)
+        sats_total = sats_confirmed + sats_unconfirmed
+        confirmed = Decimal(sats_confirmed) / SATOSHIS_PER_BTC
+        unconfirmed = Decimal(sats_unconfirmed) / SATOSHIS_PER_BTC
+        total = Decimal(sats_total) / SATOSHIS_PER_BTC
+
+        return BalanceResult(
+            address=address,
+            balance=f"{_format_btc(sats_total)} BTC",
+            confirmed=confirmed,
+            unconfirmed=unconfirmed,
+            total=total,
+            address_type=BitcoinAddressUtils.get_address_type(address)
+        )
+
+    def _fetch_balance(self, address: str) -> BalanceResult:
+        """Query balance for a single address from the Electrum server.
+
+        A single blockchain.scripthash.get_balance round-trip covers both
+        confirmed and unconfirmed funds - no wallet import or rescan is
+        involved.
+        """
         try:
-            # Convert address to scripthash
+            # One conversion doubles as the validity check (memoized, so
+            # repeated polls of the same wallet list are dict hits)
             scripthash = BitcoinAddressUtils.address_to_scripthash(address)
             if not scripthash:
-                return {
-                    "address": address,
-                    "balance": "Address conversion failed",
-                    "confirmed": Decimal("0"),
-                    "unconfirmed": Decimal("0"),
-                    "total": Decimal("0")
-                }
-            
+                return self._error_balance(address, "Invalid address")
+
             # Query balance from Electrum server with retry logic
             balance_data = None
             max_retries = 2
-            
+
             for attempt in range(max_retries):
-                balance_data = self.electrum_client.send_request(
-                    "blockchain.scripthash.get_balance", 
-                    [scripthash]
-                )
-                
+                client = self.electrum_client
+                balance_data = client.send_get_balance(scripthash)
+
                 if balance_data is not None:
                     break
-                    
+
                 # If first attempt failed, try reconnecting
                 if attempt < max_retries - 1:
                     print(f"Retrying balance query for {address}...")
-                    self.electrum_client.disconnect()
-                    time.sleep(1)
-                    self._connect_electrum()
-            
+                    self._reconnect(client)
+
             if balance_data is None:
-                return {
-                    "address": address,
-                    "balance": "Query failed",
-                    "confirmed": Decimal("0"),
-                    "unconfirmed": Decimal("0"),
-                    "total": Decimal("0")
-                }
-            
-            # Convert satoshis to BTC
-            confirmed = Decimal(balance_data.get("confirmed", 0)) / Decimal("100000000")
-            unconfirmed = Decimal(balance_data.get("unconfirmed", 0)) / Decimal("100000000")
-            total = confirmed + unconfirmed
-            
-            return {
-                "address": address,
-                "balance": f"{total:.8f} BTC",
-                "confirmed": confirmed,
-                "unconfirmed": unconfirmed,
-                "total": total
-            }
-            
+                return self._error_balance(address, "Query failed")
+
+            return self._format_balance(address, balance_data)
+
         except Exception as e:
-            return {
-                "address": address,
-                "balance": f"Error: {str(e)}",
-                "confirmed": Decimal("0"),
-                "unconfirmed": Decimal("0"),
-                "total": Decimal("0")
-            }
-    
-    def get_balances(self) -> List[Dict[str, Union[str, Decimal]]]:
-        """Get balances for all configured addresses."""
-        balances = []
-        for address in self.config.get("addresses", []):
-            balance = self.get_balance(address)
-            balances.append(balance)
-        return balances
+            return self._error_balance(address, f"Error: {str(e)}")
+
+    def _reconnect(self, failed_client: ElectrumClient):
+        """Replace a dead connection, once, no matter how many threads fail.
+
+        Concurrent callers that hit the same dead socket all land here;
+        the first one rebuilds the connection and the rest see that
+        electrum_client already changed and return without probing.
+        """
+        with self._reconnect_lock:
+            if self.electrum_client is not failed_client:
+                return  # Another thread already restored the connection
+            failed_client.disconnect()
+            time.sleep(1)
+            self._connect_electrum()
+
+    def _send_batch_with_retry(self, calls: List[Tuple[str, List]]) -> Optional[List]:
+        """Send a batch, reconnecting and retrying once if the frame fails.
+
+        Mirrors _fetch_balance's recovery path: a dropped connection
+        fails the whole frame, so rebuild the connection and replay the
+        batch before reporting failure to the caller.
+        """
+        client = self.electrum_client
+        results = client.send_batch(calls)
+        if results is None and calls:
+            print("Batch query failed, reconnecting...")
+            self._reconnect(client)
+            results = self.electrum_client.send_batch(calls)
+        return results
+
+    def get_balances(self) -> List[BalanceResult]:
+        """Get balances for all configured addresses.
+
+        All valid addresses go out in one pipelined batch, so the whole
+        list costs a single network round-trip instead of one per
+        address.
+        """
+        addresses = self.config.get("addresses", [])
+        if not addresses:
+            return []
+
+        # Resolve scripthashes up front; invalid addresses never hit the wire
+        calls = []
+        call_addresses = []
+        balances = {}
+        for address in addresses:
+            scripthash = BitcoinAddressUtils.address_to_scripthash(address)
+            if not scripthash:
+                balances[address] = self._error_balance(address, "Invalid address")
+            else:
+                calls.append(("blockchain.scripthash.get_balance", [scripthash]))
+                call_addresses.append(address)
+
+        results = self._send_batch_with_retry(calls) if calls else []
+        if results is None:
+            results = [None] * len(calls)
+
+        for address, balance_data in zip(call_addresses, results):
+            if balance_data is None:
+                balances[address] = self._error_balance(address, "Query failed")
+            else:
+                balances[address] = self._format_balance(address, balance_data)
+
+        return [balances[address] for address in addresses]
     
-    def get_transaction_history(self, address: str) -> List[Dict]:
-        """Get transaction history for an address."""
+    def get_transaction_history(self, address: str, limit: int = None,
+                                offset: int = 0) -> List[Dict]:
+        """Get transaction history for an address.
+
+        The Electrum protocol returns the full history in one response;
+        limit/offset bound what this method materializes and hands back
+        so callers that only show a page don't hold the whole list.
+        """
         try:
             scripthash = BitcoinAddressUtils.address_to_scripthash(address)
             if not scripthash:
                 return []
-            
+
             history = self.electrum_client.send_request(
                 "blockchain.scripthash.get_history",
                 [scripthash]
             )
-            
-            return history or []
-            
+
+            if not history:
+                return []
+
+            if limit is not None:
+                return history[offset:offset + limit]
+            if offset:
+                return history[offset:]
+            return history
+
         except Exception as e:
             print(f"Error getting history for {address}: {e}")
             return []
-    
+
+    def get_histories(self, addresses: List[str]) -> Dict[str, List[Dict]]:
+        """Get transaction histories for several addresses at once.
+
+        All valid addresses share a single pipelined batch, so N
+        histories cost one round-trip; invalid or failed addresses map
+        to empty lists.
+        """
+        histories = {address: [] for address in addresses}
+        if not addresses:
+            return histories
+
+        calls = []
+        call_addresses = []
+        for address in dict.fromkeys(addresses):
+            scripthash = BitcoinAddressUtils.address_to_scripthash(address)
+            if scripthash:
+                calls.append(("blockchain.scripthash.get_history", [scripthash]))
+                call_addresses.append(address)
+
+        results = self._send_batch_with_retry(calls) if calls else None
+        if results is None:
+            return histories
+
+        for address, history in zip(call_addresses, results):
+            if history:
+                histories[address] = history
+
+        return histories
+
+    def get_balance_and_history(self, address: str,
+                                limit: int = None) -> Tuple[BalanceResult, List[Dict]]:
+        """Fetch balance and history for one address in a single batch.
+
+        Both requests go out pipelined in one frame, so callers that
+        want both (e.g. the CLI's --history path) pay one round-trip
+        instead of two.
+        """
+        scripthash = BitcoinAddressUtils.address_to_scripthash(address)
+        if not scripthash:
+            return self._error_balance(address, "Invalid address"), []
+
+        results = self._send_batch_with_retry([
+            ("blockchain.scripthash.get_balance", [scripthash]),
+            ("blockchain.scripthash.get_history", [scripthash]),
+        ])
+        if results is None:
+            return self._error_balance(address, "Query failed"), []
+
+        balance_data, history = results
+        if balance_data is None:
+            balance = self._error_balance(address, "Query failed")
+        else:
+            balance = self._format_balance(address, balance_data)
+
+        if not history:
+            history = []
+        elif limit is not None:
+            history = history[:limit]
+
+        return balance, history
+
+    def get_transaction_count(self, address: str) -> Optional[int]:
+        """Get the number of transactions touching an address.
+
+        Electrum's get_history returns txids without transaction bodies,
+        so counting is a single lightweight request. The count only grows
+        between blocks, so it is cached briefly per address.
+        """
+        now = time.time()
+        cached = self._txcount_cache.get(address)
+        if cached and cached[0] > now:
+            self._txcount_cache.move_to_end(address)
+            return cached[1]
+
+        try:
+            scripthash = BitcoinAddressUtils.address_to_scripthash(address)
+            if not scripthash:
+                return None
+
+            history = self.electrum_client.send_request(
+                "blockchain.scripthash.get_history",
+                [scripthash]
+            )
+
+            count = len(history) if history else 0
+            cache = self._txcount_cache
+            cache[address] = (now + 60, count)
+            cache.move_to_end(address)
+            if len(cache) > MAX_CACHED_ADDRESSES:
+                cache.popitem(last=False)
+            return count
+
+        except Exception as e:
+            print(f"Error counting history for {address}: {e}")
+            return None
+
     def get_server_info(self) -> Dict:
-        """Get information about the connected Electrum server."""
+        """Get information about the connected Electrum server.
+
+        Server features rarely change, so results are cached for 60s.
+        """
         if not self.electrum_client:
             return {"error": "Not connected to any server"}
-        
+
+        now = time.time()
+        if self._server_info_cache and self._server_info_cache[0] > now:
+            return self._server_info_cache[1]
+
         try:
             # Get server features/info (don't call version again if already connected)
             features = self.electrum_client.send_request("server.features")
-            
-            return {
+
+            info = {
                 "server": self.current_server,
                 "features": features,
                 "connected": True
             }
+            self._server_info_cache = (now + 60, info)
+            return info
         except Exception as e:
             return {"error": str(e), "connected": False}
     
@@ -767,8 +1437,14 @@ class BitcoinTracker:
                 timeout=self.config.get("timeout", 10),
                 max_servers=self.config.get("max_discovered_servers", 20)
             )
-        
-        return self.server_discovery.discover_servers()
+
+        servers = self.server_discovery.discover_servers()
+        self._cached_servers = servers
+        return servers
+
+    def get_cached_servers(self) -> List[str]:
+        """Return the most recent discovery snapshot without blocking."""
+        return self._cached_servers
     
     def update_server_list(self) -> List[str]:
         """Update and refresh the server list."""
@@ -799,92 +1475,230 @@ class BitcoinTracker:
         except Exception as e:
             print(f"❌ Failed to save config: {e}")
     
-    def show_discovery_status(self):
-        """Show current server discovery status and health scores."""
+    def show_discovery_status(self, top: int = None):
+        """Show current server discovery status and health scores.
+
+        With `top`, only the N healthiest servers are shown, selected
+        via a partial sort instead of ordering the whole table.
+        """
         if not self.server_discovery:
             print("❌ Server discovery not initialized")
             return
         
-        print("\n" + "="*60)
-        print("🔍 SERVER DISCOVERY STATUS")
-        print("="*60)
-        
+        # Build the whole table and emit it in one write - one syscall
+        # on line-buffered terminals instead of one per server row
+        lines = [
+            "",
+            _EQ60,
+            "🔍 SERVER DISCOVERY STATUS",
+            _EQ60,
+        ]
+
         with self.server_discovery.lock:
             if not self.server_discovery.discovered_servers:
-                print("No servers discovered yet. Run discovery first.")
+                lines.append("No servers discovered yet. Run discovery first.")
+                sys.stdout.write("\n".join(lines) + "\n")
                 return
-            
-            sorted_servers = sorted(
-                self.server_discovery.discovered_servers.items(),
-                key=lambda x: x[1].get('health_score', 0),
-                reverse=True
-            )
-            
-            print(f"{'Server':<35} {'Health':<8} {'Latency':<10} {'Last Tested':<15}")
-            print("-" * 75)
-            
+
+            items = self.server_discovery.discovered_servers.items()
+            score = lambda kv: kv[1].get('health_score', 0)
+            if top:
+                # O(n log k) partial sort when only the best few matter
+                sorted_servers = heapq.nlargest(top, items, key=score)
+            else:
+                sorted_servers = sorted(items, key=score, reverse=True)
+
+            lines.append(_SERVER_TABLE_HDR)
+            lines.append(_SEP75)
+
+            # Servers checked in the same discovery pass share a
+            # timestamp to the second; format each distinct one once
+            ts_cache = {}
             for server, data in sorted_servers:
                 health = f"{data.get('health_score', 0):.1f}"
                 latency = f"{data.get('latency', 0):.2f}s"
-                last_tested = datetime.fromtimestamp(
-                    data.get('last_tested', 0)
-                ).strftime('%H:%M:%S')
-                
-                print(f"{server:<35} {health:<8} {latency:<10} {last_tested:<15}")
+                ts = int(data.get('last_tested', 0))
+                last_tested = ts_cache.get(ts)
+                if last_tested is None:
+                    last_tested = time.strftime('%H:%M:%S', time.localtime(ts))
+                    ts_cache[ts] = last_tested
+
+                lines.append(_SERVER_ROW(server, health, latency, last_tested))
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def monitor_continuous(self):
-        """Run continuous monitoring with periodic updates."""
+        """Run continuous monitoring with periodic updates.
+
+        Each tick sends one batched blockchain.scripthash.subscribe
+        round-trip; the returned status hashes act as change detectors,
+        so only addresses whose status actually moved get their balance
+        re-queried. In steady state a tick costs a single lightweight
+        round-trip regardless of wallet size.
+        """
         print("Starting continuous monitoring...")
         print("Press Ctrl+C to stop")
-        
+
+        addresses = self.config.get("addresses", [])
+        scripthashes = {
+            address: BitcoinAddressUtils.address_to_scripthash(address)
+            for address in addresses
+        }
+        statuses = {}
+        balances = {}
+        for address, scripthash in scripthashes.items():
+            if not scripthash:
+                balances[address] = self._error_balance(address, "Invalid address")
+
+        # SIGINT sets an event rather than raising KeyboardInterrupt out
+        # of a socket read mid-batch; the loop then exits at a frame
+        # boundary and the finally block always runs. Event.wait also
+        # wakes instantly on Ctrl+C instead of finishing the sleep.
+        stop = self._stop = threading.Event()
+        previous_handler = signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+        interval = self.config.get("update_interval", 60)
         try:
-            while True:
-                self._print_status()
-                time.sleep(self.config.get("update_interval", 60))
-        except KeyboardInterrupt:
+            while not stop.is_set():
+                # Pick up config edits (e.g. added addresses) without a
+                # restart; costs one stat call per tick when unchanged
+                if self._maybe_reload_config():
+                    interval = self.config.get("update_interval", 60)
+                    addresses = self.config.get("addresses", [])
+                    scripthashes = {
+                        address: BitcoinAddressUtils.address_to_scripthash(address)
+                        for address in addresses
+                    }
+                    for address, scripthash in scripthashes.items():
+                        if not scripthash and address not in balances:
+                            balances[address] = self._error_balance(address, "Invalid address")
+
+                self._print_header()
+                if not addresses:
+                    print("No addresses configured. Add addresses to config.json")
+                else:
+                    valid = [(a, sh) for a, sh in scripthashes.items() if sh]
+                    results = None
+                    if valid:
+                        # The retry helper reconnects on a dead socket and
+                        # replays the batch; since this subscribe batch runs
+                        # every tick, replaying it on the fresh connection
+                        # also re-establishes the subscriptions
+                        results = self._send_batch_with_retry(
+                            [("blockchain.scripthash.subscribe", [sh]) for _, sh in valid]
+                        )
+                    if results is None:
+                        results = [None] * len(valid)
+
+                    # Re-query only what changed (or never resolved)
+                    stale = []
+                    for (address, scripthash), status in zip(valid, results):
+                        if (status is None
+                                or statuses.get(address) != status
+                                or address not in balances):
+                            stale.append((address, scripthash, status))
+
+                    if stale:
+                        refreshed = self._send_batch_with_retry(
+                            [("blockchain.scripthash.get_balance", [sh]) for _, sh, _ in stale]
+                        )
+                        if refreshed is None:
+                            refreshed = [None] * len(stale)
+                        for (address, _, status), balance_data in zip(stale, refreshed):
+                            if balance_data is None:
+                                balances[address] = self._error_balance(address, "Query failed")
+                                # Leave the address stale: committing the
+                                # status now would suppress the re-query
+                                # until the next on-chain change, pinning
+                                # the error display indefinitely
+                                statuses.pop(address, None)
+                            else:
+                                # Commit the status only once its balance
+                                # actually landed, so failures get retried
+                                if status is not None:
+                                    statuses[address] = status
+                                result = self._format_balance(address, balance_data)
+                                balances[address] = result
+                                # Push into the TTL cache so other callers
+                                # (e.g. the API sharing this tracker) see the
+                                # refreshed value instead of a stale entry
+                                if self._balance_ttl > 0:
+                                    with self._balance_cache_lock:
+                                        cache = self._balance_cache
+                                        cache[address] = (
+                                            time.monotonic() + self._balance_ttl,
+                                            result,
+                                        )
+                                        cache.move_to_end(address)
+                                        if len(cache) > MAX_CACHED_ADDRESSES:
+                                            cache.popitem(last=False)
+
+                    self._print_balances([balances[a] for a in addresses])
+
+                stop.wait(interval)
             print("\nMonitoring stopped.")
         finally:
+            signal.signal(signal.SIGINT, previous_handler)
             if self.electrum_client:
                 self.electrum_client.disconnect()
-    
-    def _print_status(self):
-        """Print current status including server info and balances."""
-        print(f"\n{'='*60}")
-        print(f"Bitcoin Balance Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}")
-        
-        # Print server status (simplified to avoid duplicate calls)
+
+    def _print_header(self):
+        """Print the status banner and server connection line."""
         if self.current_server:
-            print(f"Connected to: {self.current_server}")
+            server_line = f"Connected to: {self.current_server}"
         else:
-            print("Server Status: Not connected")
-        
-        print("-" * 60)
-        
+            server_line = "Server Status: Not connected"
+
+        sys.stdout.write(
+            f"\n{_EQ60}\n"
+            f"Bitcoin Balance Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{_EQ60}\n"
+            f"{server_line}\n"
+            f"{_SEP60}\n"
+        )
+
+    def _print_status(self):
+        """Print current status including server info and balances."""
+        self._print_header()
+
         # Print balances
         balances = self.get_balances()
         if not balances:
             print("No addresses configured. Add addresses to config.json")
             return
-        
-        total_confirmed = Decimal("0")
-        total_unconfirmed = Decimal("0")
-        
+        self._print_balances(balances)
+
+    def _print_balances(self, balances: List[BalanceResult]):
+        """Print per-address balances and the wallet totals.
+
+        The whole block goes out in one stdout write instead of ~5 print
+        calls per address.
+        """
+        # Totals run in integer satoshis; the Decimal fields are exact
+        # multiples of 1e-8 so scaleb(8) round-trips without loss
+        total_confirmed = 0
+        total_unconfirmed = 0
+
+        parts = []
         for balance in balances:
-            addr_type = self.get_address_type(balance['address'])
-            print(f"Address: {balance['address']}")
-            print(f"  Type: {addr_type}")
-            print(f"  Balance: {balance['balance']}")
-            print(f"  Confirmed: {balance['confirmed']:.8f} BTC")
-            print(f"  Unconfirmed: {balance['unconfirmed']:.8f} BTC")
-            print()
-            
-            total_confirmed += balance['confirmed']
-            total_unconfirmed += balance['unconfirmed']
-        
-        print(f"Total Confirmed: {total_confirmed:.8f} BTC")
-        print(f"Total Unconfirmed: {total_unconfirmed:.8f} BTC")
-        print(f"Total Balance: {(total_confirmed + total_unconfirmed):.8f} BTC")
+            sats_confirmed = int(balance.confirmed.scaleb(8))
+            sats_unconfirmed = int(balance.unconfirmed.scaleb(8))
+            parts.append(
+                f"Address: {balance.address}\n"
+                f"  Type: {balance.address_type}\n"
+                f"  Balance: {balance.balance}\n"
+                f"  Confirmed: {_format_btc(sats_confirmed)} BTC\n"
+                f"  Unconfirmed: {_format_btc(sats_unconfirmed)} BTC\n\n"
+            )
+            total_confirmed += sats_confirmed
+            total_unconfirmed += sats_unconfirmed
+
+        parts.append(
+            f"Total Confirmed: {_format_btc(total_confirmed)} BTC\n"
+            f"Total Unconfirmed: {_format_btc(total_unconfirmed)} BTC\n"
+            f"Total Balance: {_format_btc(total_confirmed + total_unconfirmed)} BTC\n"
+        )
+        sys.stdout.write(''.join(parts))
 
 
 def main():
@@ -901,6 +1715,7 @@ def main():
     parser.add_argument("--update-servers", action="store_true", help="Update server list with fresh discoveries")
     parser.add_argument("--save-servers", action="store_true", help="Save discovered servers to config")
     parser.add_argument("--show-discovery", action="store_true", help="Show server discovery status and health scores")
+    parser.add_argument("--top", type=int, help="Limit --show-discovery to the N healthiest servers")
     
     args = parser.parse_args()
     
@@ -929,7 +1744,7 @@ def main():
                 tracker.save_discovered_servers(servers, args.config)
                 
         elif args.show_discovery:
-            tracker.show_discovery_status()
+            tracker.show_discovery_status(top=args.top)
             
         elif args.server_info:
             # Show server information
@@ -939,23 +1754,31 @@ def main():
                 print(f"  {key}: {value}")
                 
         elif args.address:
-            # Track single address
-            balance = tracker.get_balance(args.address)
-            addr_type = tracker.get_address_type(args.address)
-            print(f"Address: {balance['address']}")
-            print(f"Type: {addr_type}")
-            print(f"Balance: {balance['balance']}")
-            print(f"Confirmed: {balance['confirmed']:.8f} BTC")
-            print(f"Unconfirmed: {balance['unconfirmed']:.8f} BTC")
-            
+            # Track single address; with --history both queries share
+            # one pipelined round-trip
+            if args.history:
+                balance, history = tracker.get_balance_and_history(args.address, limit=10)
+            else:
+                balance = tracker.get_balance(args.address)
+                history = None
+
+            lines = [
+                f"Address: {balance.address}",
+                f"Type: {balance.address_type}",
+                f"Balance: {balance.balance}",
+                f"Confirmed: {_format_btc(int(balance.confirmed.scaleb(8)))} BTC",
+                f"Unconfirmed: {_format_btc(int(balance.unconfirmed.scaleb(8)))} BTC",
+            ]
+
             if args.history:
-                print("\nTransaction History:")
-                history = tracker.get_transaction_history(args.address)
+                lines.append("\nTransaction History:")
                 if history:
-                    for tx in history[:10]:  # Show last 10 transactions
-                        print(f"  TX: {tx.get('tx_hash', 'N/A')} Height: {tx.get('height', 'N/A')}")
+                    for tx in history:  # Show last 10 transactions
+                        lines.append(f"  TX: {tx.get('tx_hash', 'N/A')} Height: {tx.get('height', 'N/A')}")
                 else:
-                    print("  No transactions found or history unavailable")
+                    lines.append("  No transactions found or history unavailable")
+
+            sys.stdout.write("\n".join(lines) + "\n")
                     
         elif args.continuous:
             # Continuous monitoring
@@ -4,6 +4,8 @@ Simple test script for the Bitcoin Balance Tracker API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import concurrent.futures
 import json
 import time
 
@@ -18,147 +20,103 @@ TEST_ADDRESSES = [
     "bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh"  # Bech32 example
 ]
 
+# One session for the whole suite so every call reuses the same TCP
+# connection instead of paying a fresh handshake per request
+SESSION = requests.Session()
+SESSION.headers.update({
+    "X-API-Key": API_KEY,
+    "Content-Type": "application/json"
+})
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 
 def make_request(method, endpoint, data=None):
     """Make an API request"""
-    headers = {
-        "X-API-Key": API_KEY,
-        "Content-Type": "application/json"
-    }
-    
-    url = f"{API_BASE}{endpoint}"
-    
-    if method.upper() == "GET":
-        response = requests.get(url, headers=headers)
-    elif method.upper() == "POST":
-        response = requests.post(url, headers=headers, json=data)
+    return SESSION.request(method.upper(), f"{API_BASE}{endpoint}", json=data)
+
+
+def _report(title, response, expected_status=200):
+    """Build a pass/fail report block for one response."""
+    lines = [f"🔍 Testing {title}..."]
+    if response.status_code == expected_status:
+        lines.append(f"✅ {title} passed")
+        lines.append(json.dumps(response.json(), indent=2))
     else:
-        raise ValueError(f"Unsupported method: {method}")
-    
-    return response
+        lines.append(f"❌ {title} failed: {response.status_code}")
+        lines.append(response.text)
+    lines.append("")
+    return "\n".join(lines)
 
 
 def test_health_check():
     """Test health check endpoint (no auth required)"""
-    print("🔍 Testing health check...")
     response = requests.get("http://localhost:8000/health")
-    
-    if response.status_code == 200:
-        print("✅ Health check passed")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ Health check failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report("health check", response)
 
 
 def test_api_status():
     """Test API status endpoint"""
-    print("🔍 Testing API status...")
-    response = make_request("GET", "/status")
-    
-    if response.status_code == 200:
-        print("✅ API status check passed")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ API status check failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report("API status", make_request("GET", "/status"))
 
 
 def test_single_address_balance():
     """Test single address balance"""
-    print("🔍 Testing single address balance...")
     address = TEST_ADDRESSES[0]
     response = make_request("GET", f"/bitcoin/balance/{address}")
-    
-    if response.status_code == 200:
-        print(f"✅ Balance check passed for {address}")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ Balance check failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report(f"single address balance ({address})", response)
 
 
 def test_multiple_addresses_balance():
     """Test multiple addresses balance"""
-    print("🔍 Testing multiple addresses balance...")
     data = {"addresses": TEST_ADDRESSES[:2]}
     response = make_request("POST", "/bitcoin/balances", data)
-    
-    if response.status_code == 200:
-        print("✅ Multiple balance check passed")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ Multiple balance check failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report("multiple addresses balance", response)
 
 
 def test_address_validation():
     """Test address validation"""
-    print("🔍 Testing address validation...")
     data = {"address": TEST_ADDRESSES[0]}
     response = make_request("POST", "/bitcoin/validate", data)
-    
-    if response.status_code == 200:
-        print("✅ Address validation passed")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ Address validation failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report("address validation", response)
 
 
 def test_server_info():
     """Test server info"""
-    print("🔍 Testing server info...")
-    response = make_request("GET", "/bitcoin/server-info")
-    
-    if response.status_code == 200:
-        print("✅ Server info check passed")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ Server info check failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report("server info", make_request("GET", "/bitcoin/server-info"))
 
 
 def test_unauthorized_request():
     """Test unauthorized request"""
-    print("🔍 Testing unauthorized request...")
     headers = {"Content-Type": "application/json"}  # No API key
-    
     response = requests.get(f"{API_BASE}/bitcoin/balance/{TEST_ADDRESSES[0]}", headers=headers)
-    
-    if response.status_code == 401:
-        print("✅ Unauthorized request properly rejected")
-        print(json.dumps(response.json(), indent=2))
-    else:
-        print(f"❌ Unauthorized request test failed: {response.status_code}")
-        print(response.text)
-    print()
+    return _report("unauthorized request rejection", response, expected_status=401)
 
 
 def main():
     """Run all tests"""
     print("🚀 Bitcoin Balance Tracker API Test Suite\n")
     print("=" * 50)
-    
-    # Test health check first
-    test_health_check()
-    
-    # Test API endpoints
-    test_api_status()
-    test_single_address_balance()
-    test_multiple_addresses_balance()
-    test_address_validation()
-    test_server_info()
-    
-    # Test security
-    test_unauthorized_request()
-    
+
+    # Health check first: if the server isn't up, nothing else matters
+    print(test_health_check())
+
+    # The remaining tests are independent, so run them concurrently and
+    # print the reports in order - wall time is the slowest endpoint
+    # instead of the sum of all of them, and it exercises the API's own
+    # concurrency handling
+    tests = [
+        test_api_status,
+        test_single_address_balance,
+        test_multiple_addresses_balance,
+        test_address_validation,
+        test_server_info,
+        test_unauthorized_request,
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test) for test in tests]
+        for future in futures:
+            print(future.result())
+
     print("🏁 Test suite completed!")
     print("\nTo start the API server:")
     print("python api/main.py")
@@ -167,4 +125,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -5,51 +5,71 @@ Test script to verify Electrum server connection and basic functionality.
 
 import sys
 import json
+import concurrent.futures
 from bitcoin_tracker import BitcoinTracker, ElectrumClient
 
+def _probe_server(host, port):
+    """Connect to one server; returns a live client or None."""
+    client = ElectrumClient(host, port, use_ssl=True, timeout=5)
+    if client.connect():
+        return client
+    return None
+
 def test_electrum_connection():
     """Test connection to Electrum servers."""
     print("Testing Electrum server connection...")
-    
+
     # Test servers
     test_servers = [
         ("electrum.hsmiths.com", 50002),
         ("stavver.dyshek.org", 50002),
     ]
-    
-    for host, port in test_servers:
-        print(f"\nTesting {host}:{port}...")
-        
-        client = ElectrumClient(host, port, use_ssl=True, timeout=5)
-        
-        if client.connect():
-            print(f"✓ Connected successfully!")
-            
-            # Test server version
-            version = client.send_request("server.version", ["TestClient", "1.4"])
-            if version:
-                print(f"✓ Server version: {version}")
-            else:
-                print("✗ Failed to get server version")
-            
-            # Test server features
-            features = client.send_request("server.features")
-            if features:
-                print(f"✓ Server features available")
-                if 'server_version' in features:
-                    print(f"  Server version: {features['server_version']}")
-                if 'protocol_max' in features:
-                    print(f"  Protocol version: {features['protocol_max']}")
+
+    # Probe all servers at once so a dead one doesn't burn its full
+    # timeout before we try the next; keep the first that answers.
+    client = None
+    host = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(test_servers)) as executor:
+        futures = {
+            executor.submit(_probe_server, h, p): (h, p)
+            for h, p in test_servers
+        }
+        for future in concurrent.futures.as_completed(futures):
+            h, p = futures[future]
+            result = future.result()
+            if result is None:
+                print(f"✗ Failed to connect to {h}:{p}")
+            elif client is None:
+                client = result
+                host = h
+                print(f"✓ Connected to {h}:{p}")
             else:
-                print("✗ Failed to get server features")
-                
-            client.disconnect()
-            print(f"✓ Disconnected from {host}")
-            return True
-        else:
-            print(f"✗ Failed to connect to {host}:{port}")
-    
-    return False
+                result.disconnect()  # Already have a winner
+
+    if client is None:
+        return False
+
+    # Test server version
+    version = client.send_request("server.version", ["TestClient", "1.4"])
+    if version:
+        print(f"✓ Server version: {version}")
+    else:
+        print("✗ Failed to get server version")
+
+    # Test server features
+    features = client.send_request("server.features")
+    if features:
+        print(f"✓ Server features available")
+        if 'server_version' in features:
+            print(f"  Server version: {features['server_version']}")
+        if 'protocol_max' in features:
+            print(f"  Protocol version: {features['protocol_max']}")
+    else:
+        print("✗ Failed to get server features")
+
+    client.disconnect()
+    print(f"✓ Disconnected from {host}")
+    return True
 
 def test_address_conversion():
     """Test Bitcoin address to scripthash conversion."""
@@ -107,7 +127,7 @@ def test_balance_query():
         
         print(f"Result: {balance}")
         
-        if "Error" not in balance["balance"]:
+        if "Error" not in balance.balance:
             print("✓ Balance query successful!")
         else:
             print("✗ Balance query failed")